@@ -0,0 +1,295 @@
+"""
+A benchmark of the rune page and skill order renderers.
+
+Create a fixture of every champion's stored runes and skills:
+
+    $ python -m benchmark.imaging dump
+
+Then render every champion with cold and warm caches:
+
+    $ python -m benchmark.imaging run
+
+Each renderer and phase is measured in a fresh process, because the
+peak resident set size never decreases within a process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from imaging.cache import render
+from imaging.rune import Runepage, atlas
+from imaging.skill import SkillOrder, get_badge, get_font, get_tiles
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Any
+
+
+root = Path(__file__).parent
+fixture = root.joinpath('fixture.json')
+results = root.joinpath('results')
+
+renderers = {
+    'runepage': (Runepage, 'runes'),
+    'skillorder': (SkillOrder, 'skills'),
+}
+
+
+def clear() -> None:
+    """
+    A function that empties every cache used by the renderers.
+    """
+
+    atlas.color.clear()
+    atlas.grayscale.clear()
+
+    get_font.cache_clear()
+    get_badge.cache_clear()
+    get_tiles.cache_clear()
+
+
+def get_rss() -> int:
+    """
+    A function that returns the peak resident set size in kilobytes.
+    """
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS reports the peak resident set size in bytes.
+    if sys.platform == 'darwin':
+        rss = rss // 1024
+
+    return rss
+
+
+def get_commit() -> str | None:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            cwd=root,
+            text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return commit.stdout.strip()
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    samples = sorted(samples)
+    index = min(len(samples) - 1, int(len(samples) * percent))
+    return samples[index]
+
+
+def measure(
+    renderer: type,
+    inputs: dict[str, Any],
+    cold: bool
+) -> dict[str, Any]:
+    latency = []
+    size = []
+
+    baseline = get_rss()
+
+    if not cold:
+        clear()
+
+        for data in inputs.values():
+            render(renderer, data)
+
+    for data in inputs.values():
+        if cold:
+            clear()
+
+        start = time.perf_counter()
+        buffer = render(renderer, data)
+        latency.append(time.perf_counter() - start)
+
+        size.append(len(buffer))
+
+    return {
+        'count': len(latency),
+        'p50': percentile(latency, 0.50) * 1000,
+        'p99': percentile(latency, 0.99) * 1000,
+        'mean': statistics.fmean(latency) * 1000,
+        'rss': get_rss(),
+        'baseline': baseline,
+        'png': {
+            'mean': statistics.fmean(size),
+            'maximum': max(size),
+        },
+    }
+
+
+def load(path: Path) -> dict[str, Any]:
+    with path.open('r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def spawn(path: Path, name: str, phase: str) -> dict[str, Any]:
+    """
+    A function that measures a renderer and phase in a fresh process,
+    so its peak resident set size is not inherited from another phase.
+    """
+
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-m',
+            'benchmark.imaging',
+            '--fixture',
+            str(path.resolve()),
+            'phase',
+            name,
+            phase
+        ],
+        capture_output=True,
+        check=True,
+        cwd=root.parent,
+        text=True
+    )
+
+    return json.loads(process.stdout)
+
+
+def phase(arguments: argparse.Namespace) -> None:
+    data = load(arguments.fixture)
+
+    renderer, key = renderers[arguments.renderer]
+    cold = arguments.phase == 'cold'
+
+    result = measure(renderer, data[key], cold=cold)
+    print(json.dumps(result))
+
+
+def run(arguments: argparse.Namespace) -> None:
+    data = load(arguments.fixture)
+
+    report = {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'fixture': arguments.fixture.name,
+        'renderers': {},
+    }
+
+    for name, (_, key) in renderers.items():
+        if not data.get(key):
+            continue
+
+        report['renderers'][name] = {
+            'cold': spawn(arguments.fixture, name, 'cold'),
+            'warm': spawn(arguments.fixture, name, 'warm'),
+        }
+
+    for name, phases in report['renderers'].items():
+        for phase, result in phases.items():
+            print(
+                f"{name:<12} {phase:<5} "
+                f"p50 {result['p50']:8.2f} ms  "
+                f"p99 {result['p99']:8.2f} ms  "
+                f"rss {result['rss']:>8} KiB  "
+                f"(+{result['rss'] - result['baseline']:>7} KiB)  "
+                f"png {result['png']['mean']:>9.0f} B"
+            )
+
+    output = arguments.output
+
+    if output is None:
+        results.mkdir(exist_ok=True)
+        output = results.joinpath(f"{report['commit'] or 'unknown'}.json")
+
+    with output.open('w', encoding='utf-8') as file:
+        json.dump(report, file, indent=4)
+
+    print(f"The results were saved to {output}.")
+
+
+async def select() -> dict[str, Any]:
+    from bot import configuration
+    from database.engine import lol
+    from database.lol import Ability, Build
+
+    await lol.set_bind(configuration['database']['postgresql'] + 'lol')
+
+    rows = await (
+        Build
+        .query
+        .where(Build.region == 'kr')
+        .where(Build.mode == 'aram')
+        .gino
+        .all()
+    )
+    abilities = await Ability.query.gino.all()
+
+    images = {
+        ability.champion_id: [
+            ability.q_image,
+            ability.w_image,
+            ability.e_image,
+            ability.r_image
+        ]
+        for ability in abilities
+    }
+
+    await lol.pop_bind().close()
+
+    return {
+        'runes': {
+            row.champion_id: row.runes
+            for row in rows
+            if row.runes
+        },
+        'skills': {
+            row.champion_id: [row.skills, [images[row.champion_id]]]
+            for row in rows
+            if row.skills and row.champion_id in images
+        },
+    }
+
+
+def dump(arguments: argparse.Namespace) -> None:
+    data = asyncio.run(select())
+
+    with arguments.fixture.open('w', encoding='utf-8') as file:
+        json.dump(data, file, indent=4, sort_keys=True)
+
+    print(f"{len(data['runes'])} champions were saved to {arguments.fixture}.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fixture', type=Path, default=fixture)
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparser = subparsers.add_parser('run')
+    subparser.add_argument('--output', type=Path, default=None)
+    subparser.set_defaults(func=run)
+
+    subparser = subparsers.add_parser('phase')
+    subparser.add_argument('renderer', choices=renderers)
+    subparser.add_argument('phase', choices=('cold', 'warm'))
+    subparser.set_defaults(func=phase)
+
+    subparser = subparsers.add_parser('dump')
+    subparser.set_defaults(func=dump)
+
+    arguments = parser.parse_args()
+    arguments.func(arguments)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import aiohttp
 import asyncio
 import discord
 import logging
@@ -25,7 +24,10 @@ from random import SystemRandom
 from sqlalchemy import func
 from tabulate import tabulate
 from typing import TYPE_CHECKING
+from utilities.catalog import catalog
+from utilities.executor import Executor
 from utilities.format import format_list
+from utilities.session import Sessions
 from utilities.time import midnight
 
 if TYPE_CHECKING:
@@ -107,6 +109,43 @@ class Viking(commands.Bot):
         self.wow_api_id = configuration['wow']['id']
         self.wow_api_key = configuration['wow']['key']
 
+        # League of Legends
+        self.catalog_interval = configuration['lol'].getint('catalog', fallback=3600)
+        self.lol_concurrency = configuration['lol'].getint('concurrency', fallback=5)
+        self.lol_font = configuration['lol'].get('font', fallback=None)
+
+        # A champion thumbnail is either uploaded as an attachment, or
+        # linked to Data Dragon with "url" to save upstream bandwidth.
+        self.lol_thumbnail = configuration['lol'].get(
+            'thumbnail',
+            fallback='attachment'
+        )
+
+        # Executor
+        self.processes = configuration.getint('executor', 'processes', fallback=2)
+        self.threads = configuration.getint('executor', 'threads', fallback=4)
+
+        # The workers are only started on the first submission, so the
+        # executor is created with the bot for the cogs to use.
+        self.executor = Executor(
+            processes=self.processes,
+            threads=self.threads,
+            font=self.lol_font
+        )
+
+        # Download
+        self.download_buffer = configuration.getint(
+            'download',
+            'buffer',
+            fallback=262144
+        )
+
+        self.sound_maximum = configuration.getint(
+            'download',
+            'sound',
+            fallback=10485760
+        )
+
     @property
     def guild(self) -> str:
         identifier = self.identifier.get()
@@ -143,7 +182,14 @@ class Viking(commands.Bot):
         await nac.set_bind(self.uri + 'nac')
         await viking.set_bind(self.uri + 'viking')
 
-        self.session = aiohttp.ClientSession(loop=self.loop)
+        await catalog.load()
+
+        self.loop.create_task(
+            catalog.watch(self.catalog_interval)
+        )
+
+        self.sessions = Sessions(configuration)
+        self.session = self.sessions.default
 
     def get_extensions(self) -> None:
         for path in self.root.joinpath('cogs').iterdir():
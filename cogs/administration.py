@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import database.engine
+import discord
 import logging
 import paramiko
 
@@ -18,6 +19,53 @@ class Administration(commands.Cog):
         self.logs = viking.logs
         self.root = viking.root
 
+    def execute(self, command: str) -> None:
+        """
+        A function that runs a command on my Raspberry Pi over SSH.
+        It blocks, so it is run in the executor's thread pool.
+        """
+
+        client = paramiko.SSHClient()
+
+        path = self.root.joinpath('known_hosts')
+        client.load_host_keys(path)
+
+        client.connect(
+            hostname=configuration['paramiko']['hostname'],
+            username=configuration['paramiko']['username'],
+            password=configuration['paramiko']['password'],
+        )
+
+        client.exec_command(command)
+        client.close()
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def executor(self, ctx: commands.Context) -> None:
+        """
+        *executor
+
+        A command that displays the queue depth and latency of the
+        rendering and I/O executors.
+        """
+
+        embed = discord.Embed(
+            colour=self.viking.color,
+            title='Executor'
+        )
+
+        for name, metric in self.viking.executor.statistics().items():
+            embed.add_field(
+                inline=False,
+                name=name.title(),
+                value=f"{metric['pending']} pending, "
+                      f"{metric['completed']} completed\n"
+                      f"p50: {metric['p50'] * 1000:.0f} ms, "
+                      f"p99: {metric['p99'] * 1000:.0f} ms"
+            )
+
+        await ctx.send(embed=embed)
+
     @commands.command(hidden=True)
     @commands.is_owner()
     async def kill(self, ctx: commands.Context) -> None:
@@ -40,7 +88,8 @@ class Administration(commands.Cog):
         await database.engine.command.pop_bind().close()
         await database.engine.lol.pop_bind().close()
 
-        await self.viking.session.close()
+        await self.viking.sessions.close()
+        self.viking.executor.shutdown()
         await self.viking.close()
 
     @commands.command(hidden=True)
@@ -54,20 +103,11 @@ class Administration(commands.Cog):
 
         await ctx.message.delete()
 
-        client = paramiko.SSHClient()
-
-        path = self.root.joinpath('known_hosts')
-        client.load_host_keys(path)
-
-        client.connect(
-            hostname=configuration['paramiko']['hostname'],
-            username=configuration['paramiko']['username'],
-            password=configuration['paramiko']['password'],
+        await self.viking.executor.io(
+            self.execute,
+            'sudo /sbin/reboot'
         )
 
-        client.exec_command('sudo /sbin/reboot')
-        client.close()
-
         log.info('Viking is restarting.')
 
         guild = database.engine.Guild()
@@ -78,7 +118,8 @@ class Administration(commands.Cog):
         await database.engine.command.pop_bind().close()
         await database.engine.lol.pop_bind().close()
 
-        await self.viking.session.close()
+        await self.viking.sessions.close()
+        self.viking.executor.shutdown()
         await self.viking.close()
 
     @commands.command(hidden=True)
@@ -92,22 +133,10 @@ class Administration(commands.Cog):
 
         await ctx.message.delete()
 
-        client = paramiko.SSHClient()
-
-        path = self.root.joinpath('known_hosts')
-        client.load_host_keys(path)
-
-        client.connect(
-            hostname=configuration['paramiko']['hostname'],
-            username=configuration['paramiko']['username'],
-            password=configuration['paramiko']['password'],
-        )
-
         path = Path('/home/brayden/Documents/wol.sh')
         command = f"bash {path}"
 
-        client.exec_command(command)
-        client.close()
+        await self.viking.executor.io(self.execute, command)
 
     @commands.command(hidden=True)
     @commands.is_owner()
@@ -17,7 +17,7 @@ from sqlalchemy.dialects.postgresql import insert
 from typing import TYPE_CHECKING
 from utilities.format import alphanumerical
 from utilities.member import MemberInterface
-from utilities.request import download
+from utilities.request import download, RequestError
 
 if TYPE_CHECKING:
     from bot import Viking
@@ -184,7 +184,24 @@ class Audio(commands.Cog):
                 if member.exists() or default.exists():
                     return await ctx.send(f"'{name}' already exists. Please use another filename.")
 
-                await download(self.viking.session, attachment.url, member)
+                try:
+                    await download(
+                        self.viking.session,
+                        attachment.url,
+                        member,
+                        executor=self.viking.executor,
+                        maximum=self.viking.sound_maximum,
+                        buffer=self.viking.download_buffer
+                    )
+                except RequestError as exception:
+                    log.warning(exception)
+
+                    if exception.status == 413:
+                        message = f"'{name}' is too large. Please use a smaller file."
+                    else:
+                        message = f"'{name}' could not be downloaded. Please try again."
+
+                    return await ctx.send(message)
 
                 date = datetime.now(timezone.utc)
 
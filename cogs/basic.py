@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 import discord
 import time
 
 from discord.ext import commands
-from json import JSONDecodeError
 from math import floor
 from typing import TYPE_CHECKING
 from utilities.format import format_time, random_case
-from utilities.request import fetch
+from utilities.request import fetch, RequestError
 
 if TYPE_CHECKING:
     from bot import Viking
@@ -182,17 +180,17 @@ class Basic(commands.Cog):
         url = 'https://api.forismatic.com/api/1.0/'
 
         # The Forismatic API will occassionally return malformed JSON,
-        # so reinvoke the command, until we recieve a proper response.
+        # which is retried by the request, until the retry budget is
+        # spent.
 
         try:
             response = await fetch(
-                self.viking.session,
+                self.viking.sessions.forismatic,
                 url,
                 params=params
             )
-        except JSONDecodeError:
-            await asyncio.sleep(1)
-            await ctx.reinvoke()
+        except RequestError:
+            await ctx.send('A quotation could not be found.')
         else:
             quote = response.get('quoteText')
             author = response.get('quoteAuthor')
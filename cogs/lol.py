@@ -1,46 +1,98 @@
 from __future__ import annotations
 
+import asyncio
 import discord
 import logging
+import time
 
 from discord.ext import commands
+from imaging.cache import RenderCache, Warmup
 from imaging.rune import Runepage
-from imaging.skill import SkillOrder
+from imaging.skill import SkillOrder, set_font
 from io import BytesIO
 from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
 from utilities.lol import (
     ASSET,
-    Game,
-    Participants,
-    Summoner,
+    ITEMSET_TTL,
+    MODE,
+    MODES,
+    REGION,
+    REGIONS,
     get_active_game,
     get_summoner_account,
     get_summoner_leagues,
-    get_champion,
-    get_champion_id,
-    get_champion_image,
+    get_champion_items,
     get_champion_name,
     get_champion_runes,
     get_champion_skill,
-    get_champion_statistics,
     get_item_name,
-    get_spell_statistics,
     get_spell_version,
     get_mastery,
     get_placement,
-    search_for_spell
+    game_cache,
+    itemset_cache,
+    league_cache,
+    limiter,
+    mastery_cache,
+    parse_build_query,
+    participant_cache,
+    resolve_champion,
+    resolve_spell,
+    summoner_cache
 )
+from utilities.cache import TTLCache
+from utilities.catalog import catalog
 from utilities.format import format_list
-from utilities.request import fetch, RequestError
+from utilities.request import fetch, flights, RequestError
 
 if TYPE_CHECKING:
     from bot import Viking
+    from collections.abc import Callable
+    from database.lol import Champion, Spell
     from discord.ext.commands import Context
+    from model.lol import Participants
+    from typing_extensions import Any
+    from utilities.catalog import Snapshot
 
 
 log = logging.getLogger(__name__)
 
 
+# An embed or thumbnail is replaced by a new patch, rather than by its
+# time-to-live.
+
+EMBED_TTL = 86400
+THUMBNAIL_TTL = 86400
+
+# An attachment URL is signed by Discord, and expires at the timestamp
+# of its "ex" parameter. The URL is no longer reused shortly before it
+# expires, and an unsigned URL is reused for a day.
+
+ATTACHMENT_TTL = 86400
+ATTACHMENT_MARGIN = 300
+
+
+def get_lifetime(url: str) -> float:
+    """
+    A function that returns the number of seconds an attachment URL
+    can be reused for.
+    """
+
+    query = parse_qs(urlparse(url).query)
+    expiry = query.get('ex')
+
+    if not expiry:
+        return ATTACHMENT_TTL
+
+    try:
+        timestamp = int(expiry[0], 16)
+    except ValueError:
+        return 0
+
+    return timestamp - time.time() - ATTACHMENT_MARGIN
+
+
 class LeagueOfLegends(commands.Cog):
     def __init__(self, viking: Viking):
         self.viking = viking
@@ -48,16 +100,208 @@ class LeagueOfLegends(commands.Cog):
         self.lol_api_key = viking.lol_api_key
         self.lol_api_url = viking.lol_api_url
         self.params = {'api_key': self.lol_api_key}
+        self.concurrency = viking.lol_concurrency
 
-    @commands.command()
-    async def build(self, ctx: Context, *, champion_name: str) -> None:
+        directory = viking.root.joinpath('cache/render')
+        self.renders = RenderCache(directory, viking.executor)
+        self.warmup = Warmup(self.renders, viking.executor)
+        self.embeds = TTLCache('embed', maximum=512)
+
+        self.attachments = TTLCache('attachment', maximum=512)
+
+        self.thumbnail = viking.lol_thumbnail
+        self.thumbnails = TTLCache('thumbnail', maximum=256)
+
+        set_font(viking.lol_font)
+
+    async def cog_load(self) -> None:
+        catalog.subscribe(self.on_patch)
+
+    async def cog_unload(self) -> None:
+        catalog.unsubscribe(self.on_patch)
+        self.warmup.cancel()
+
+    def on_patch(self, _: Snapshot) -> None:
+        """
+        A function that is called when the catalog is reloaded for a
+        new patch.
+        """
+
+        self.invalidate()
+
+    @commands.Cog.listener()
+    async def on_assets_synced(self) -> None:
+        """
+        An event that is called when a sync has changed the images of
+        the images/lol directory.
+        """
+
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        A function that is called when the icons and statistics may have
+        changed, so every render, embed and thumbnail is discarded, and
+        the renders are warmed again.
+        """
+
+        self.warmup.cancel()
+
+        # The workers decoded the icons of the previous patch when they
+        # started, so they are replaced before anything is rendered.
+        self.viking.executor.restart()
+
+        self.renders.clear()
+        self.embeds.clear()
+        self.thumbnails.clear()
+        self.attachments.clear()
+
+        self.warmup.start(self.get_warmup_inputs)
+
+    async def get_warmup_inputs(self) -> list[tuple[type, Any]]:
+        """
+        A function that returns the rune page and skill order of every
+        champion, region and mode, to be rendered by the warm-up.
+        """
+
+        snapshot = await catalog.get()
+        inputs = []
+
+        for champion_id in snapshot.champion:
+            for region in REGIONS:
+                for mode in MODES:
+                    runes = await get_champion_runes(champion_id, region, mode)
+
+                    if runes:
+                        inputs.append((Runepage, runes))
+
+                    skill = await get_champion_skill(champion_id, region, mode)
+                    skills, abilities = skill
+
+                    if skills and abilities:
+                        inputs.append((SkillOrder, skill))
+
+        return inputs
+
+    async def get_thumbnail(self, champion: Champion) -> tuple[str, list[discord.File]]:
+        """
+        A function that returns the thumbnail URL of a champion, and the
+        attachment to send with it, if any. The image is either linked
+        to Data Dragon, or read from memory rather than disk.
+        """
+
+        if self.thumbnail == 'url':
+            snapshot = await catalog.get()
+            version = snapshot.version.champion
+
+            url = f"{ASSET}/cdn/{version}/img/champion/{champion.full_image}"
+            return (url, [])
+
+        entry = self.thumbnails.get(champion.full_image)
+
+        if entry is None:
+            path = self.viking.champion.joinpath(champion.full_image)
+            buffer = await self.viking.executor.io(path.read_bytes)
+
+            self.thumbnails.set(champion.full_image, buffer, THUMBNAIL_TTL)
+        else:
+            buffer = entry.value
+
+        file = discord.File(
+            fp=BytesIO(buffer),
+            filename='thumbnail.png'
+        )
+
+        return ('attachment://thumbnail.png', [file])
+
+    async def send_render(
+        self,
+        ctx: Context,
+        embed: discord.Embed,
+        files: list[discord.File],
+        renderer: type,
+        data: Any,
+        filename: str
+    ) -> None:
+        """
+        A function that sends a render as the image of an embed. A
+        render is only uploaded once, and its attachment URL is reused
+        until it expires or its message is deleted.
+        """
+
+        key = self.renders.key(renderer, data)
+        entry = self.attachments.get(key)
+
+        if entry is not None:
+            url, _ = entry.value
+
+            embed.set_image(url=url)
+            await ctx.send(embed=embed, files=files)
+            return
+
+        _, buffer = await self.renders.get(renderer, data)
+
+        file = discord.File(
+            fp=BytesIO(buffer),
+            filename=filename
+        )
+
+        embed.set_image(url=f"attachment://{filename}")
+        message = await ctx.send(embed=embed, files=[file, *files])
+
+        for attachment in message.attachments:
+            if attachment.filename == filename:
+                lifetime = get_lifetime(attachment.url)
+
+                if lifetime > 0:
+                    value = (attachment.url, message.id)
+                    self.attachments.set(key, value, lifetime)
+
+    def forget_attachments(self, message_ids: set[int]) -> None:
+        """
+        A function that forgets the attachment URL of every render that
+        was uploaded in a deleted message, because Discord stops serving
+        its attachments.
+        """
+
+        keys = [
+            key
+            for key, entry in self.attachments.entries.items()
+            if entry.value[1] in message_ids
+        ]
+
+        for key in keys:
+            self.attachments.delete(key)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(
+        self,
+        payload: discord.RawMessageDeleteEvent
+    ) -> None:
         """
-        *build <name>
+        An event that is called when a message is deleted.
         """
 
-        champion = await get_champion(champion_name)
-        champion_id = await get_champion_id(champion)
-        champion_image = await get_champion_image(champion)
+        self.forget_attachments({payload.message_id})
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(
+        self,
+        payload: discord.RawBulkMessageDeleteEvent
+    ) -> None:
+        """
+        An event that is called when messages are deleted in bulk, such
+        as by the purge of the spam channel.
+        """
+
+        self.forget_attachments(payload.message_ids)
+
+    async def fetch_recommended_items(self, champion_id: str) -> dict[str, list[str]]:
+        """
+        A function that requests the recommended items for ranked
+        Summoner's Rift, and resolves the name of each item, grouped by
+        the title of each block.
+        """
 
         url = f"{self.lol_api_url}/opgg/ranked/sr/items/{champion_id}"
         response = await fetch(self.viking.session, url)
@@ -82,22 +326,110 @@ class LeagueOfLegends(commands.Cog):
 
                     build[title] = items
 
-        embed = discord.Embed(
-            colour=self.viking.color,
-            title=f"Recommended Items for {champion}"
-        )
+        if not build.get('Starting'):
+            build.pop('Starting', None)
 
-        fp = self.viking.champion.joinpath(champion_image)
+        return build
 
-        file = discord.File(
-            fp=fp,
-            filename='thumbnail.png'
-        )
+    def get_previous_items(self, champion: Champion) -> dict[str, list[str]] | None:
+        """
+        A function that returns the most recent recommended items of a
+        champion from any patch, if there are any.
+        """
+
+        for (champion_id, _), entry in reversed(itemset_cache.entries.items()):
+            if champion_id == champion.id:
+                return entry.value
+
+        return None
+
+    async def get_recommended_items(self, champion: Champion) -> dict[str, list[str]]:
+        """
+        A function that returns the recommended items of a champion for
+        the current patch. An expired build is returned immediately,
+        and refreshed in the background. If a new patch can not be
+        requested, the build of a previous patch is returned.
+        """
+
+        snapshot = await catalog.get()
+        key = (champion.id, snapshot.version.champion)
+
+        try:
+            return await itemset_cache.fetch(
+                key,
+                ITEMSET_TTL,
+                self.fetch_recommended_items,
+                champion.id
+            )
+        except RequestError as exception:
+            build = self.get_previous_items(champion)
+
+            if build is None:
+                raise
+
+            log.warning(f"The items of a previous patch were used: {exception}")
+            return build
+
+    async def get_stored_items(
+        self,
+        champion: Champion,
+        region: str,
+        mode: str
+    ) -> dict[str, list[str]]:
+        """
+        A function that returns the items of a region and mode from the
+        build store.
+        """
+
+        items = await get_champion_items(champion.id, region, mode)
+
+        if not items:
+            return {}
+
+        return {
+            'Items': [await get_item_name(item) for item in items]
+        }
 
-        embed.set_thumbnail(url='attachment://thumbnail.png')
+    @commands.command()
+    async def build(self, ctx: Context, *, query: str) -> None:
+        """
+        *build [region] [mode] <name>
+        """
+
+        region, mode, champion_name = parse_build_query(query)
+        champion = await resolve_champion(champion_name)
+
+        if champion is None:
+            await ctx.send('No champion found.')
+            return
+
+        # The recommended items are only available for ranked Summoner's
+        # Rift, so any other region or mode is read from the build store.
+        if region is None and mode is None:
+            try:
+                build = await self.get_recommended_items(champion)
+            except RequestError:
+                message = 'The recommended items are unavailable. Please try again.'
+                await ctx.send(message)
+                return
+        else:
+            build = await self.get_stored_items(
+                champion,
+                region or REGION,
+                mode or MODE
+            )
+
+        if not build:
+            await ctx.send(f"No build was found for {champion.name}.")
+            return
+
+        embed = discord.Embed(
+            colour=self.viking.color,
+            title=f"Recommended Items for {champion.name}"
+        )
 
-        if not build['Starting']:
-            del build['Starting']
+        url, files = await self.get_thumbnail(champion)
+        embed.set_thumbnail(url=url)
 
         for key in build:
             items = format_list(
@@ -112,51 +444,143 @@ class LeagueOfLegends(commands.Cog):
                 value=items
             )
 
-        await ctx.send(embed=embed, file=file)
+        await ctx.send(embed=embed, files=files)
 
     @commands.command()
-    async def skill(self, ctx: Context, *, champion_name: str) -> None:
+    async def skill(self, ctx: Context, *, query: str) -> None:
         """
-        *skill <name>
+        *skill [region] [mode] <name>
         """
 
-        champion = await get_champion(champion_name)
-        champion_id = await get_champion_id(champion)
-        champion_image = await get_champion_image(champion)
-        skill = await get_champion_skill(champion_id)
+        region, mode, champion_name = parse_build_query(query)
+        region, mode = region or REGION, mode or MODE
+
+        champion = await resolve_champion(champion_name)
+
+        if champion is None:
+            await ctx.send('No champion found.')
+            return
 
-        # Skill Order
-        image = await self.viking.loop.run_in_executor(
-            None,
+        skill = await get_champion_skill(champion.id, region, mode)
+
+        skills, abilities = skill
+
+        if not skills or not abilities:
+            await ctx.send(f"No skill order was found for {champion.name}.")
+            return
+
+        # Thumbnail
+        url, files = await self.get_thumbnail(champion)
+
+        title = f"Skill Order for {champion.name} ({region.upper()} {mode.upper()})"
+
+        embed = discord.Embed(title=title)
+        embed.set_thumbnail(url=url)
+
+        await self.send_render(
+            ctx,
+            embed,
+            files,
             SkillOrder,
-            skill
+            skill,
+            'skillorder.png'
         )
 
-        fp = BytesIO()
-        image.save(fp, 'png')
-        fp.seek(0)
+    def get_champion_embed(self, champion: Champion) -> dict[str, Any]:
+        """
+        A function that builds the statistics of a champion, and returns
+        the embed as a dictionary.
+        """
 
-        skillorder = discord.File(
-            fp=fp,
-            filename='skillorder.png'
+        embed = discord.Embed(
+            colour=self.viking.color,
+            title=champion.name
         )
 
-        # Thumbnail
-        fp = self.viking.champion.joinpath(champion_image)
-
-        thumbnail = discord.File(
-            fp=fp,
-            filename='thumbnail.png'
+        embed.add_field(
+            inline=False,
+            name='Health',
+            value=f"{champion.health} "
+                  f"(+{champion.health_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Health Regeneration',
+            value=f"{champion.health_regeneration} "
+                  f"(+{champion.health_regeneration_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Mana',
+            value=f"{champion.mana} "
+                  f"(+{champion.mana_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Mana Regeneration',
+            value=f"{champion.mana_regeneration} "
+                  f"(+{champion.mana_regeneration_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Armor',
+            value=f"{champion.armor} "
+                  f"(+{champion.armor_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Movement Speed',
+            value=champion.movement_speed
+        )
+        embed.add_field(
+            inline=False,
+            name='Attack Range',
+            value=champion.attack_range
+        )
+        embed.add_field(
+            inline=False,
+            name='Attack Damage',
+            value=f"{champion.attack_damage} "
+                  f"(+{champion.attack_damage_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Attack Speed',
+            value=f"{champion.attack_speed} "
+                  f"(+{champion.attack_speed_per_level} per level)"
+        )
+        embed.add_field(
+            inline=False,
+            name='Critical Strike',
+            value=f"{champion.critical_strike} "
+                  f"(+{champion.critical_strike_per_level} per level)"
         )
 
-        title = f"Skill Order for {champion_name}"
+        return embed.to_dict()
 
-        embed = discord.Embed(title=title)
-        embed.set_thumbnail(url='attachment://thumbnail.png')
-        embed.set_image(url='attachment://skillorder.png')
+    def get_embed(
+        self,
+        command: str,
+        entity: Champion | Spell,
+        version: str,
+        func: Callable[..., dict[str, Any]],
+        *args
+    ) -> discord.Embed:
+        """
+        A function that returns the embed of a command for an entity,
+        which is only built once for each patch.
+        """
 
-        files = [skillorder, thumbnail]
-        await ctx.send(embed=embed, files=files)
+        key = (command, entity.id, version)
+        entry = self.embeds.get(key)
+
+        if entry is None:
+            payload = func(entity, *args)
+            self.embeds.set(key, payload, EMBED_TTL)
+        else:
+            payload = entry.value
+
+        return discord.Embed.from_dict(payload)
 
     @commands.command()
     async def champion(self, ctx: Context, *, champion_name: str) -> None:
@@ -167,87 +591,59 @@ class LeagueOfLegends(commands.Cog):
         """
 
         async with ctx.typing():
-            name = await get_champion(champion_name)
-            champion = await get_champion_statistics(name)
-            champion_image = await get_champion_image(name)
+            champion = await resolve_champion(champion_name)
 
-            embed = discord.Embed(
-                colour=self.viking.color,
-                title=champion.name
-            )
+            if champion is None:
+                await ctx.send('No champion found.')
+                return
 
-            fp = self.viking.champion.joinpath(champion_image)
+            snapshot = await catalog.get()
 
-            file = discord.File(
-                fp=fp,
-                filename='thumbnail.png'
+            embed = self.get_embed(
+                'champion',
+                champion,
+                snapshot.version.champion,
+                self.get_champion_embed
             )
 
-            embed.set_thumbnail(url='attachment://thumbnail.png')
+            url, files = await self.get_thumbnail(champion)
+            embed.set_thumbnail(url=url)
 
-            embed.add_field(
-                inline=False,
-                name='Health',
-                value=f"{champion.health} "
-                      f"(+{champion.health_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Health Regeneration',
-                value=f"{champion.health_regeneration} "
-                      f"(+{champion.health_regeneration_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Mana',
-                value=f"{champion.mana} "
-                      f"(+{champion.mana_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Mana Regeneration',
-                value=f"{champion.mana_regeneration} "
-                      f"(+{champion.mana_regeneration_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Armor',
-                value=f"{champion.armor} "
-                      f"(+{champion.armor_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Movement Speed',
-                value=champion.movement_speed
-            )
-            embed.add_field(
-                inline=False,
-                name='Attack Range',
-                value=champion.attack_range
-            )
-            embed.add_field(
-                inline=False,
-                name='Attack Damage',
-                value=f"{champion.attack_damage} "
-                      f"(+{champion.attack_damage_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Attack Speed',
-                value=f"{champion.attack_speed} "
-                      f"(+{champion.attack_speed_per_level} per level)"
-            )
-            embed.add_field(
-                inline=False,
-                name='Critical Strike',
-                value=f"{champion.critical_strike} "
-                      f"(+{champion.critical_strike_per_level} per level)"
-            )
+        await ctx.send(embed=embed, files=files)
+
+    async def get_participant(
+        self,
+        semaphore: asyncio.Semaphore,
+        participant: Participants
+    ) -> tuple[Participants, str, str]:
+        """
+        A function that looks up the champion and placement of a
+        participant. A failed lookup is displayed as unavailable, rather
+        than failing the entire game.
+        """
+
+        async with semaphore:
+            champion = await get_champion_name(participant.champion)
+
+            if champion is None:
+                champion = 'Unavailable'
+
+            try:
+                leagues = await get_summoner_leagues(
+                    self.viking.sessions.riot,
+                    self.params,
+                    participant.id
+                )
+
+                placement = await get_placement(leagues)
+            except Exception as exception:
+                log.warning(exception)
+                placement = 'Unavailable'
 
-        await ctx.send(embed=embed, file=file)
+        return (participant, champion, placement)
 
     @commands.command(aliases=['live'])
-    @commands.cooldown(rate=1, per=10.0, type=commands.BucketType.default)
+    @commands.cooldown(rate=1, per=10.0, type=commands.BucketType.user)
     async def game(self, ctx: Context, *, summoner_name: str) -> None:
         """
         *game <username>
@@ -257,8 +653,8 @@ class LeagueOfLegends(commands.Cog):
         """
 
         try:
-            get_game = await get_active_game(
-                self.viking.session,
+            game = await get_active_game(
+                self.viking.sessions.riot,
                 self.params,
                 summoner_name
             )
@@ -266,8 +662,6 @@ class LeagueOfLegends(commands.Cog):
             await ctx.send('No game or summoner found.')
         else:
             async with ctx.typing():
-                game = Game(get_game)
-
                 main = discord.Embed(
                     title='Game',
                     description=f"{game.mode}"
@@ -281,16 +675,16 @@ class LeagueOfLegends(commands.Cog):
                     colour=discord.Colour.red()
                 )
 
-                for participant in game.participants:
-                    participant = Participants(participant)
-                    leagues = await get_summoner_leagues(
-                        self.viking.session,
-                        self.params,
-                        participant.id
-                    )
-                    placement = await get_placement(leagues)
-                    champion = await get_champion_name(participant.champion)
+                semaphore = asyncio.Semaphore(self.concurrency)
+
+                participants = await asyncio.gather(
+                    *[
+                        self.get_participant(semaphore, participant)
+                        for participant in game.participants
+                    ]
+                )
 
+                for participant, champion, placement in participants:
                     if participant.team == 100:
                         blue.add_field(
                             inline=False,
@@ -310,43 +704,82 @@ class LeagueOfLegends(commands.Cog):
             await ctx.send(embed=red)
 
     @commands.command()
-    async def rune(self, ctx: Context, *, champion_name: str) -> None:
-        champion = await get_champion(champion_name)
-        runes = await get_champion_runes(champion)
-        champion_image = await get_champion_image(champion)
-
-        # Runepage
-        image = await self.viking.loop.run_in_executor(
-            None,
-            Runepage,
-            runes
-        )
+    async def rune(self, ctx: Context, *, query: str) -> None:
+        """
+        *rune [region] [mode] <name>
+        """
 
-        fp = BytesIO()
-        image.save(fp, 'png')
-        fp.seek(0)
+        region, mode, champion_name = parse_build_query(query)
+        region, mode = region or REGION, mode or MODE
 
-        runepage = discord.File(
-            fp=fp,
-            filename='runepage.png'
-        )
+        champion = await resolve_champion(champion_name)
+
+        if champion is None:
+            await ctx.send('No champion found.')
+            return
+
+        runes = await get_champion_runes(champion.id, region, mode)
+
+        if not runes:
+            await ctx.send(f"No runepage was found for {champion.name}.")
+            return
 
         # Thumbnail
-        fp = self.viking.champion.joinpath(champion_image)
+        url, files = await self.get_thumbnail(champion)
 
-        thumbnail = discord.File(
-            fp=fp,
-            filename='thumbnail.png'
+        title = f"Runepage for {champion.name} ({region.upper()} {mode.upper()})"
+
+        embed = discord.Embed(title=title)
+        embed.set_thumbnail(url=url)
+
+        await self.send_render(
+            ctx,
+            embed,
+            files,
+            Runepage,
+            runes,
+            'runepage.png'
         )
 
-        title = f"Runepage for {champion_name}"
+    def get_spell_embed(self, spell: Spell, version: str) -> dict[str, Any]:
+        """
+        A function that builds the statistics of a summoner spell, and
+        returns the embed as a dictionary.
+        """
 
-        embed = discord.Embed(title=title)
-        embed.set_thumbnail(url='attachment://thumbnail.png')
-        embed.set_image(url='attachment://runepage.png')
+        embed = discord.Embed(
+            colour=self.viking.color
+        )
+        embed.set_thumbnail(
+            url=f"{ASSET}/cdn/{version}/img/spell/{spell.full_image}"
+        )
+        embed.add_field(
+            inline=False,
+            name='Name',
+            value=spell.name
+        )
+        embed.add_field(
+            inline=False,
+            name='Description',
+            value=spell.description
+        )
+        embed.add_field(
+            inline=False,
+            name='Acquired',
+            value=f"Level {spell.level}"
+        )
+        embed.add_field(
+            inline=False,
+            name='Range',
+            value=f"{spell.spell_range} units"
+        )
+        embed.add_field(
+            inline=False,
+            name='Cooldown',
+            value=f"{spell.cooldown} seconds"
+        )
 
-        files = [runepage, thumbnail]
-        await ctx.send(embed=embed, files=files)
+        return embed.to_dict()
 
     @commands.command()
     async def spell(self, ctx: Context, *, spell_name: str) -> None:
@@ -357,46 +790,150 @@ class LeagueOfLegends(commands.Cog):
         """
 
         async with ctx.typing():
-            name = await search_for_spell(spell_name)
-            spell = await get_spell_statistics(name)
+            spell = await resolve_spell(spell_name)
+
+            if spell is None:
+                await ctx.send('No summoner spell found.')
+                return
+
             version = await get_spell_version()
 
-            embed = discord.Embed(
-                colour=self.viking.color
-            )
-            embed.set_thumbnail(
-                url=f"{ASSET}/cdn/{version}/img/spell/{spell.full_image}"
+            embed = self.get_embed(
+                'spell',
+                spell,
+                version,
+                self.get_spell_embed,
+                version
             )
-            embed.add_field(
-                inline=False,
-                name='Name',
-                value=spell.name
-            )
-            embed.add_field(
-                inline=False,
-                name='Description',
-                value=spell.description
-            )
-            embed.add_field(
-                inline=False,
-                name='Acquired',
-                value=f"Level {spell.level}"
+
+        await ctx.send(embed=embed)
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def cache(self, ctx: Context) -> None:
+        """
+        *cache
+
+        A command that displays the size, hits and misses of each Riot
+        API cache.
+        """
+
+        embed = discord.Embed(
+            colour=self.viking.color,
+            title='Riot API Cache'
+        )
+
+        caches = (
+            summoner_cache,
+            league_cache,
+            mastery_cache,
+            game_cache,
+            participant_cache,
+            itemset_cache,
+            self.embeds,
+            self.thumbnails,
+            self.attachments
+        )
+
+        for cache in caches:
+            statistics = cache.statistics()
+
+            value = (
+                f"{statistics['size']}/{statistics['maximum']} entries "
+                f"[{statistics['hits']} hits, {statistics['misses']} misses]"
             )
+
+            if 'stale' in statistics:
+                value = (
+                    f"{value} [{statistics['stale']} stale, "
+                    f"{statistics['failures']} failed refreshes]"
+                )
+
             embed.add_field(
                 inline=False,
-                name='Range',
-                value=f"{spell.spell_range} units"
+                name=cache.name.title(),
+                value=value
             )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def warmup(self, ctx: Context) -> None:
+        """
+        *warmup
+
+        A command that starts pre-rendering the rune page and skill
+        order of every champion, or displays its progress.
+        """
+
+        started = self.warmup.start(self.get_warmup_inputs)
+        progress = self.warmup.progress()
+
+        done = progress['rendered'] + progress['skipped'] + progress['failed']
+
+        status = 'Started' if started else 'Running'
+
+        embed = discord.Embed(
+            colour=self.viking.color,
+            title='Render Warm-up'
+        )
+
+        embed.add_field(
+            inline=False,
+            name=status,
+            value=f"{done}/{progress['total']} renders "
+                  f"[{progress['rendered']} rendered, "
+                  f"{progress['skipped']} cached, "
+                  f"{progress['failed']} failed] "
+                  f"in {progress['elapsed']:.0f} seconds"
+        )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def quota(self, ctx: Context) -> None:
+        """
+        *quota
+
+        A command that displays the remaining Riot API requests for the
+        application and each method, and the number of identical
+        requests that were coalesced.
+        """
+
+        headroom = limiter.headroom()
+
+        embed = discord.Embed(
+            colour=self.viking.color,
+            title='Riot API Quota'
+        )
+
+        for name, buckets in headroom.items():
+            windows = [
+                f"{remaining}/{limit} per {interval} seconds"
+                for remaining, limit, interval in buckets
+            ]
+
+            if not windows:
+                windows = ['Unknown']
+
             embed.add_field(
                 inline=False,
-                name='Cooldown',
-                value=f"{spell.cooldown} seconds"
+                name=name.title(),
+                value=format_list(windows, sort=False)
             )
 
+        embed.add_field(
+            inline=False,
+            name='Coalesced',
+            value=f"{flights.coalesced} identical requests were saved"
+        )
+
         await ctx.send(embed=embed)
 
     @commands.command()
-    @commands.cooldown(rate=1, per=5.0, type=commands.BucketType.default)
+    @commands.cooldown(rate=1, per=5.0, type=commands.BucketType.user)
     async def summoner(self, ctx: Context, *, summoner_name: str) -> None:
         """
         *summoner <username>
@@ -408,8 +945,8 @@ class LeagueOfLegends(commands.Cog):
         """
 
         try:
-            get_summoner = await get_summoner_account(
-                self.viking.session,
+            summoner = await get_summoner_account(
+                self.viking.sessions.riot,
                 self.params,
                 summoner_name
             )
@@ -417,15 +954,14 @@ class LeagueOfLegends(commands.Cog):
             await ctx.send('No summoner found.')
         else:
             async with ctx.typing():
-                summoner = Summoner(get_summoner)
                 leagues = await get_summoner_leagues(
-                    self.viking.session,
+                    self.viking.sessions.riot,
                     self.params,
                     summoner.id
                 )
                 placement = await get_placement(leagues)
                 champions = await get_mastery(
-                    self.viking.session,
+                    self.viking.sessions.riot,
                     self.params,
                     summoner.id
                 )
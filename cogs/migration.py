@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncpg
 import database.engine
+import logging
+import time
 
 from database.command import Hidden, Public
 from database.nac import Member, Role, Sound
 from database.viking import Member, Role, Sound
 from datetime import datetime, timezone
 from discord.ext import commands
-from sqlalchemy import func
+from sqlalchemy import func, text
 from typing import TYPE_CHECKING
+from utilities.catalog import catalog
+from utilities.ddragon import ingest, sync
+from utilities.lol import MODES, REGIONS, set_builds
+from utilities.request import RequestError
 
 if TYPE_CHECKING:
     from bot import Viking
@@ -16,6 +23,9 @@ if TYPE_CHECKING:
     from discord.ext.commands import Context
 
 
+log = logging.getLogger(__name__)
+
+
 class Migration(commands.Cog):
     def __init__(self, viking: Viking):
         self.viking = viking
@@ -220,6 +230,147 @@ class Migration(commands.Cog):
             await engine.gino.create_all()
 
         await database.engine.command.gino.create_all()
+        await database.engine.lol.gino.create_all()
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def consolidate(self, ctx: Context) -> None:
+        """
+        *consolidate
+
+        A command that copies the builds of every op.gg region and mode
+        table into the build table, and updates any build that has
+        changed. A table that does not exist is skipped.
+        """
+
+        await ctx.message.delete()
+
+        builds = []
+        missing = []
+
+        for region in REGIONS:
+            for mode in MODES:
+                table = f"opgg_{region}_{mode}"
+
+                exists = await database.engine.lol.scalar(
+                    text('SELECT to_regclass(:table)'),
+                    table=table
+                )
+
+                if exists is None:
+                    missing.append(table)
+                    continue
+
+                query = text(
+                    f"""
+                    SELECT
+                        champion_id,
+                        runes,
+                        skills,
+                        items,
+                        created_at,
+                        updated_at
+                    FROM {table}
+                    """
+                )
+
+                rows = await database.engine.lol.all(query)
+
+                builds.extend(
+                    {**dict(row), 'region': region, 'mode': mode}
+                    for row in rows
+                )
+
+        # Every build is upserted in a single statement, so a build that
+        # changed since the previous consolidation is updated.
+        await set_builds(builds)
+
+        if missing:
+            tables = ', '.join(missing)
+            log.warning(f"The {tables} table(s) do not exist.")
+
+            await ctx.send(f"The {tables} table(s) do not exist, and were skipped.")
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def ingest(self, ctx: Context, *, location: str = None) -> None:
+        """
+        *ingest <directory or URL>
+
+        A command that loads the latest patch, or the patch in a local
+        directory or URL, from Data Dragon into the lol database.
+        """
+
+        async with ctx.typing():
+            start = time.perf_counter()
+
+            try:
+                count = await ingest(
+                    self.viking.sessions.ddragon,
+                    self.viking.executor,
+                    location
+                )
+            except (
+                OSError,
+                ValueError,
+                RequestError,
+                asyncpg.PostgresError
+            ) as exception:
+                log.warning(exception)
+                await ctx.send(f"The patch could not be ingested: {exception}")
+                return
+
+            await catalog.load()
+
+            elapsed = time.perf_counter() - start
+
+        rows = ', '.join(
+            f"{amount} {table}"
+            for table, amount in count.items()
+        )
+
+        await ctx.send(f"Ingested {rows} in {elapsed:.1f} seconds.")
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def sync(self, ctx: Context, *, location: str = None) -> None:
+        """
+        *sync <directory or URL>
+
+        A command that downloads the images of the latest patch, or
+        the patch in a local directory or URL, that have changed.
+        """
+
+        async with ctx.typing():
+            start = time.perf_counter()
+
+            directory = self.viking.images.joinpath('lol')
+
+            try:
+                count = await sync(
+                    self.viking.sessions.ddragon,
+                    self.viking.executor,
+                    directory,
+                    location
+                )
+            except (OSError, ValueError, RequestError) as exception:
+                log.warning(exception)
+                await ctx.send(f"The images could not be synced: {exception}")
+                return
+
+            elapsed = time.perf_counter() - start
+
+        # The workers, renders and thumbnails still hold the images that
+        # were replaced or removed.
+        if count['downloaded'] or count['removed']:
+            self.viking.dispatch('assets_synced')
+
+        assets = ', '.join(
+            f"{amount} {status}"
+            for status, amount in count.items()
+        )
+
+        await ctx.send(f"Synced the images ({assets}) in {elapsed:.1f} seconds.")
 
     @commands.command(hidden=True)
     @commands.is_owner()
@@ -34,12 +34,15 @@ class Weather(commands.Cog):
         url = f"{self.owm_api_url}/weather?q={location}&units=metric"
 
         try:
-            response = await fetch(self.viking.session, url, params=params)
+            forecast = await fetch(
+                self.viking.sessions.owm,
+                url,
+                model=Forecast,
+                params=params
+            )
         except RequestError:
             await ctx.send('No location found.')
         else:
-            forecast = Forecast(response)
-
             degree = '\u00B0'
 
             embed = discord.Embed(colour=self.viking.color)
@@ -134,51 +134,23 @@ class Version(lol.Model):
     sticker = lol.Column(lol.String(10), nullable=True)
 
 
-# op.gg
-
-class OPGGNANormal(lol.Model):
-    __tablename__ = 'opgg_na_normal'
-
-    champion_id = lol.Column(lol.String(10), lol.ForeignKey('champion.id'), primary_key=True, nullable=False)
-    runes = lol.Column(lol.ARRAY(lol.Integer()), nullable=True)
-    skills = lol.Column(lol.ARRAY(lol.CHAR(1)), nullable=True)
-    items = lol.Column(lol.ARRAY(lol.String()), nullable=True)
-    created_at = lol.Column(lol.DateTime(), nullable=True)
-    updated_at = lol.Column(lol.DateTime(), nullable=True)
-
-    _fk_champion_id = lol.ForeignKeyConstraint(['champion_id'], ['champion.id'])
-
-
-class OPGGNAARAM(lol.Model):
-    __tablename__ = 'opgg_na_aram'
-
-    champion_id = lol.Column(lol.String(10), lol.ForeignKey('champion.id'), primary_key=True, nullable=False)
-    runes = lol.Column(lol.ARRAY(lol.Integer()), nullable=True)
-    skills = lol.Column(lol.ARRAY(lol.CHAR(1)), nullable=True)
-    items = lol.Column(lol.ARRAY(lol.String()), nullable=True)
-    created_at = lol.Column(lol.DateTime(), nullable=True)
-    updated_at = lol.Column(lol.DateTime(), nullable=True)
-
-    _fk_champion_id = lol.ForeignKeyConstraint(['champion_id'], ['champion.id'])
-
-
-class OPGGKRNormal(lol.Model):
-    __tablename__ = 'opgg_kr_normal'
+class SummonerIdentifier(lol.Model):
+    __tablename__ = 'summoner_identifier'
 
-    champion_id = lol.Column(lol.String(10), lol.ForeignKey('champion.id'), primary_key=True, nullable=False)
-    runes = lol.Column(lol.ARRAY(lol.Integer()), nullable=True)
-    skills = lol.Column(lol.ARRAY(lol.CHAR(1)), nullable=True)
-    items = lol.Column(lol.ARRAY(lol.String()), nullable=True)
-    created_at = lol.Column(lol.DateTime(), nullable=True)
-    updated_at = lol.Column(lol.DateTime(), nullable=True)
+    name = lol.Column(lol.String(50), primary_key=True, nullable=False)
+    summoner_id = lol.Column(lol.String(100), nullable=False)
+    updated_at = lol.Column(lol.DateTime(timezone=True), nullable=False)
 
-    _fk_champion_id = lol.ForeignKeyConstraint(['champion_id'], ['champion.id'])
 
+# op.gg
 
-class OPGGKRARAM(lol.Model):
-    __tablename__ = 'opgg_kr_aram'
+class Build(lol.Model):
+    __tablename__ = 'build'
 
+    # The composite primary key is the index of every lookup.
     champion_id = lol.Column(lol.String(10), lol.ForeignKey('champion.id'), primary_key=True, nullable=False)
+    region = lol.Column(lol.String(5), primary_key=True, nullable=False)
+    mode = lol.Column(lol.String(10), primary_key=True, nullable=False)
     runes = lol.Column(lol.ARRAY(lol.Integer()), nullable=True)
     skills = lol.Column(lol.ARRAY(lol.CHAR(1)), nullable=True)
     items = lol.Column(lol.ARRAY(lol.String()), nullable=True)
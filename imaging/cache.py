@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import shutil
+import tempfile
+import time
+
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+from utilities.atomic import write
+from utilities.flight import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from PIL import Image
+    from typing_extensions import Any
+    from utilities.executor import Executor
+
+
+log = logging.getLogger(__name__)
+
+
+def encode(image: Image.Image) -> bytes:
+    fp = BytesIO()
+    image.save(fp, 'png')
+    return fp.getvalue()
+
+
+def render(renderer: type, data: Any) -> bytes:
+    image = renderer(data)
+    return encode(image)
+
+
+class RenderCache:
+    """
+    A cache of rendered images, keyed by a hash of the renderer, its
+    version and its input. The encoded PNG is kept in memory, and
+    backed by a directory on disk.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        executor: Executor,
+        maximum: int = 128
+    ):
+        self.directory = directory
+        self.executor = executor
+        self.maximum = maximum
+        self.entries = OrderedDict()
+        self.flights = SingleFlight()
+        self.generation = 0
+        self.task = None
+
+    def key(self, renderer: type, data: Any) -> str:
+        version = getattr(renderer, 'version', 0)
+        identifier = repr((renderer.__name__, version, data))
+
+        return hashlib.sha256(
+            identifier.encode('utf-8')
+        ).hexdigest()
+
+    def remember(self, key: str, buffer: bytes) -> None:
+        self.entries[key] = buffer
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maximum:
+            self.entries.popitem(last=False)
+
+    def read(self, key: str) -> bytes | None:
+        path = self.directory.joinpath(f"{key}.png")
+
+        if not path.exists():
+            return None
+
+        return path.read_bytes()
+
+    def write(self, key: str, buffer: bytes) -> None:
+        path = self.directory.joinpath(f"{key}.png")
+        write(path, buffer)
+
+    def exists(self, key: str) -> bool:
+        return (
+            key in self.entries or
+            self.directory.joinpath(f"{key}.png").exists()
+        )
+
+    async def get(
+        self,
+        renderer: type,
+        data: Any,
+        remember: bool = True
+    ) -> tuple[str, bytes]:
+        """
+        A function that returns the key and encoded PNG of a render,
+        and only renders the image if it is not in memory or on disk.
+        An identical render that is in progress is shared.
+        """
+
+        key = self.key(renderer, data)
+        buffer = self.entries.get(key)
+
+        generation = self.generation
+
+        if buffer is None:
+            buffer = await self.flights.run(key, self.load, key, renderer, data)
+
+        if remember and generation == self.generation:
+            self.remember(key, buffer)
+
+        return (key, buffer)
+
+    async def load(self, key: str, renderer: type, data: Any) -> bytes:
+        generation = self.generation
+        buffer = await self.executor.io(self.read, key)
+
+        if buffer is None:
+            buffer = await self.executor.render(render, renderer, data)
+
+            # A render that started before the cache was cleared may use
+            # the icons of the previous patch, so it is not kept.
+            if generation == self.generation:
+                await self.executor.io(self.write, key, buffer)
+
+        return buffer
+
+    def purge(self) -> None:
+        """
+        A function that deletes every directory of renders that was
+        moved aside, including any that were left by a restart.
+        """
+
+        for path in self.directory.parent.glob(f".{self.directory.name}.*"):
+            shutil.rmtree(path, ignore_errors=True)
+
+    def clear(self) -> None:
+        """
+        A function that discards every render. The directory is moved
+        aside in a single rename, and deleted by a thread, so the event
+        loop is not blocked by an unlink of every render.
+        """
+
+        self.generation = self.generation + 1
+        self.entries.clear()
+        self.flights = SingleFlight()
+
+        if not self.directory.exists():
+            return
+
+        aside = tempfile.mkdtemp(
+            dir=self.directory.parent,
+            prefix=f".{self.directory.name}."
+        )
+
+        self.directory.rename(
+            Path(aside).joinpath(self.directory.name)
+        )
+
+        self.task = asyncio.create_task(
+            self.executor.io(self.purge)
+        )
+
+
+class Warmup:
+    """
+    A background job that fills the render cache, one render at a
+    time, and only while no other render is waiting for the process
+    pool.
+    """
+
+    def __init__(
+        self,
+        renders: RenderCache,
+        executor: Executor,
+        interval: float = 0.5
+    ):
+        self.renders = renders
+        self.executor = executor
+        self.interval = interval
+        self.task = None
+
+        self.total = 0
+        self.rendered = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(
+        self,
+        collect: Callable[[], Awaitable[list[tuple[type, Any]]]]
+    ) -> bool:
+        """
+        A function that starts warming the render cache with the
+        renderers and inputs that are collected, unless it is already
+        being warmed.
+        """
+
+        if self.running:
+            return False
+
+        self.total = 0
+        self.rendered = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+        self.task = asyncio.create_task(self.run(collect))
+        return True
+
+    def cancel(self) -> None:
+        if self.running:
+            self.task.cancel()
+
+        self.task = None
+
+    async def idle(self) -> None:
+        metric = self.executor.metrics['process']
+
+        while metric.pending > 0:
+            await asyncio.sleep(self.interval)
+
+    async def run(
+        self,
+        collect: Callable[[], Awaitable[list[tuple[type, Any]]]]
+    ) -> None:
+        inputs = await collect()
+        self.total = len(inputs)
+
+        for renderer, data in inputs:
+            key = self.renders.key(renderer, data)
+            exists = await self.executor.io(self.renders.exists, key)
+
+            if exists:
+                self.skipped = self.skipped + 1
+                continue
+
+            # An interactive render always goes first.
+            await self.idle()
+
+            try:
+                await self.renders.get(renderer, data, remember=False)
+            except Exception as exception:
+                self.failed = self.failed + 1
+                log.warning(f"{renderer.__name__} could not be warmed: {exception}")
+            else:
+                self.rendered = self.rendered + 1
+
+        self.finished = time.monotonic()
+
+        log.info(
+            f"The render cache was warmed: {self.rendered} rendered, "
+            f"{self.skipped} skipped and {self.failed} failed."
+        )
+
+    def progress(self) -> dict[str, Any]:
+        end = self.finished or time.monotonic()
+        elapsed = end - self.started if self.started is not None else 0.0
+
+        return {
+            'running': self.running,
+            'total': self.total,
+            'rendered': self.rendered,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'elapsed': elapsed,
+        }
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from io import BytesIO
 from pathlib import Path
 from PIL import Image
+from utilities.atomic import write
 
 
 lol = Path(__file__).parent.parent.joinpath('images/lol')
 
 
+def grayscale(source: Path, destination: Path) -> None:
+    """
+    A function that creates the grayscale variant of a rune icon, and
+    keeps its transparency.
+    """
+
+    with Image.open(source) as image:
+        image = image.convert('LA').convert('RGBA')
+
+    fp = BytesIO()
+    image.save(fp, 'png')
+
+    write(destination, fp.getvalue())
+
+
 class Rune():
     def __init__(self):
         self.keystone = None
@@ -178,15 +195,75 @@ class Shard(Rune):
 
 class RuneFactory:
     def __new__(self, id: int) -> Rune:
-        rune = {
-            8000: Precision(),
-            8100: Domination(),
-            8200: Sorcery(),
-            8300: Inspiration(),
-            8400: Resolve()
-        }
+        return TREES.get(id)
+
+
+# The rune trees never change, so they are only created once.
+
+TREES = {
+    8000: Precision(),
+    8100: Domination(),
+    8200: Sorcery(),
+    8300: Inspiration(),
+    8400: Resolve()
+}
+
+SHARD = Shard()
+
+
+class Atlas:
+    """
+    A cache of every rune icon, in color and grayscale, that has been
+    decoded and resized to the size of the grid.
+    """
+
+    def __init__(self, width: int = 32, height: int = 32):
+        self.width = width
+        self.height = height
+        self.color = {}
+        self.grayscale = {}
+
+    def open(self, path: Path) -> Image.Image:
+        dimension = (self.width, self.height)
+
+        with Image.open(path) as image:
+            return image.resize(dimension, Image.Resampling.LANCZOS)
+
+    def load(self) -> None:
+        """
+        A function that decodes every rune icon, so a render never has
+        to open a file.
+        """
 
-        return rune.get(id)
+        for directory, icons in (
+            ('color', self.color),
+            ('grayscale', self.grayscale)
+        ):
+            path = lol.joinpath('rune', directory)
+
+            if not path.exists():
+                continue
+
+            for file in path.glob('*.png'):
+                icons[file.name] = self.open(file)
+
+    def get(self, filename: str, color: bool = True) -> Image.Image:
+        if color:
+            directory, icons = 'color', self.color
+        else:
+            directory, icons = 'grayscale', self.grayscale
+
+        image = icons.get(filename)
+
+        if image is None:
+            path = lol.joinpath('rune', directory, filename)
+            image = self.open(path)
+            icons[filename] = image
+
+        return image
+
+
+atlas = Atlas()
 
 
 class Grid():
@@ -249,15 +326,8 @@ class Primary(Grid):
             length = len(rune)
 
             for rid, filename in rune.items():
-                if index == 0 or rid in perk:
-                    path = lol.joinpath('rune/color', filename)
-                else:
-                    path = lol.joinpath('rune/grayscale', filename)
-
-                image = Image.open(path)
-
-                dimension = (self.width, self.height)
-                image = image.resize(dimension, Image.Resampling.LANCZOS)
+                color = index == 0 or rid in perk
+                image = atlas.get(filename, color=color)
 
                 if length == 1:
                     x = x + (self.width + 40)
@@ -310,15 +380,8 @@ class Secondary(Grid):
                 if index == 1:
                     continue
 
-                if index == 0 or rid in perk:
-                    path = lol.joinpath('rune/color', filename)
-                else:
-                    path = lol.joinpath('rune/grayscale', filename)
-
-                image = Image.open(path)
-
-                dimension = (self.width, self.height)
-                image = image.resize(dimension, Image.Resampling.LANCZOS)
+                color = index == 0 or rid in perk
+                image = atlas.get(filename, color=color)
 
                 if length == 1:
                     x = x + (self.width + 40)
@@ -351,7 +414,7 @@ class Tertiary(Grid):
         self.height = 32
         self.offset = 16
         self.row = 4
-        self.runes = Shard()
+        self.runes = SHARD
         self.width = 32
 
     def create(self, perk):
@@ -374,16 +437,13 @@ class Tertiary(Grid):
                 current = 0
 
                 if perk and rid == perk[current] and previous is None:
-                    path = lol.joinpath('rune/color', filename)
+                    color = True
                     previous = index
                     perk.remove(rid)
                 else:
-                    path = lol.joinpath('rune/grayscale', filename)
+                    color = False
 
-                image = Image.open(path)
-
-                dimension = (self.width, self.height)
-                image = image.resize(dimension, Image.Resampling.LANCZOS)
+                image = atlas.get(filename, color=color)
 
                 box = (x, y)
                 self.grid.paste(image, box=box)
@@ -401,6 +461,8 @@ class Tertiary(Grid):
 
 
 class Runepage:
+    version = 1
+
     def __new__(self, rune):
         pid, sid, *perk = rune
 
@@ -1,30 +1,130 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 
 lol = Path(__file__).parent.parent.joinpath('images/lol')
 
+# The fonts that are tried, in order, when no font is configured.
 
-class SkillOrder:
-    def __new__(self, data):
-        skills, images = data
-        q, w, e, r = images[0]
+FONTS = [
+    Path('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'),
+    Path('/usr/share/fonts/TTF/DejaVuSans-Bold.ttf'),
+    Path('C:/Windows/Fonts/Arial.ttf'),
+]
+
+# The position of each letter within its badge.
+
+POSITION = {
+    'Q': (6.5, 2.5),
+    'W': (6, 2.5),
+    'E': (8, 2.5),
+    'R': (7, 2.5),
+}
+
+# The font that is configured, which is set in each rendering process.
+
+configuration = {'font': None}
+
+
+def set_font(path: Path | str | None) -> None:
+    """
+    A function to configure the font of the skill badges. If it is not
+    set, the first font that exists in FONTS is used.
+    """
+
+    configuration['font'] = Path(path) if path else None
+
+    get_font.cache_clear()
+    get_badge.cache_clear()
+    get_tiles.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    font = configuration['font']
+    candidates = [font, *FONTS] if font else FONTS
+
+    for path in candidates:
+        if path.exists():
+            return ImageFont.truetype(str(path), size)
+
+    # The default font is scaled, so a badge keeps the size that its
+    # letters are positioned for.
+    return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=None)
+def get_badge(skill: str) -> Image.Image:
+    """
+    A function that draws the translucent badge of a skill's letter.
+    """
+
+    badge = Image.new(
+        'LA',
+        size=(28, 28),
+        color=0
+    )
 
-        path = lol.joinpath('spell')
+    badge.putalpha(192)
 
-        q = path.joinpath(q)
-        q = Image.open(q)
+    draw = ImageDraw.Draw(badge)
 
-        w = path.joinpath(w)
-        w = Image.open(w)
+    draw.text(
+        POSITION[skill],
+        skill,
+        font=get_font(18),
+    )
 
-        e = path.joinpath(e)
-        e = Image.open(e)
+    return badge
 
-        r = path.joinpath(r)
-        r = Image.open(r)
+
+@lru_cache(maxsize=32)
+def get_tiles(images: tuple[str, str, str, str]) -> dict[str, Image.Image]:
+    """
+    A function that composes the icon and badge of each of a champion's
+    abilities, so a render only has to paste the tiles.
+    """
+
+    path = lol.joinpath('spell')
+    tiles = {}
+
+    for skill, filename in zip('QWER', images, strict=True):
+        with Image.open(path.joinpath(filename)) as icon:
+            tile = icon.copy()
+
+        badge = get_badge(skill)
+
+        tile.paste(
+            badge,
+            (36, 40),
+            mask=badge
+        )
+
+        tiles[skill] = tile
+
+    return tiles
+
+
+def preload() -> None:
+    """
+    A function that loads the font and draws every badge ahead of the
+    first render. The ability icons differ for every champion, so they
+    are composed on demand and kept by get_tiles.
+    """
+
+    for skill in POSITION:
+        get_badge(skill)
+
+
+class SkillOrder:
+    version = 2
+
+    def __new__(self, data):
+        skills, images = data
+        tiles = get_tiles(tuple(images[0]))
 
         row = len(skills)
         column = 1
@@ -44,49 +144,8 @@ class SkillOrder:
         y = (offset * column) // (column + 1)
 
         for skill in skills:
-            match skill:
-                case 'Q':
-                    image = q.copy()
-                    dimension = (6.5, 2.5)
-                case 'W':
-                    image = w.copy()
-                    dimension = (6, 2.5)
-                case 'E':
-                    image = e.copy()
-                    dimension = (8, 2.5)
-                case 'R':
-                    image = r.copy()
-                    dimension = (7, 2.5)
-
-            background = Image.new(
-                'LA',
-                size=(28, 28),
-                color=0
-            )
-
-            background.putalpha(192)
-
-            draw = ImageDraw.Draw(background)
-
-            font = ImageFont.truetype(
-                'C:/Windows/Fonts/Arial.ttf',
-                18
-            )
-
-            draw.text(
-                dimension,
-                skill,
-                font=font,
-            )
-
-            image.paste(
-                background,
-                (36, 40),
-                mask=background
-            )
-
             box = (x, y)
-            grid.paste(image, box=box)
+            grid.paste(tiles[skill], box=box)
 
             x = x + (width + 10)
 
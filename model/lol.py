@@ -1,19 +1,44 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import msgspec
 
+from typing import ClassVar
 
-@dataclass
-class Game:
-    __slots__ = (
-        'id',
-        'map',
-        'type',
-        'queue',
-        'participants'
-    )
 
-    QUEUES = {
+# Each model is decoded directly from the body of a response, and any
+# field that is not declared is skipped without being materialized.
+
+class Participants(
+    msgspec.Struct,
+    rename={
+        'id': 'summonerId',
+        'name': 'summonerName',
+        'team': 'teamId',
+        'champion': 'championId'
+    }
+):
+    id: str | None = None
+    name: str | None = None
+    team: int | None = None
+    champion: int | None = None
+
+
+class Game(
+    msgspec.Struct,
+    rename={
+        'id': 'gameId',
+        'map': 'mapId',
+        'type': 'gameType',
+        'queue': 'gameQueueConfigId'
+    }
+):
+    id: int | None = None
+    map: int | None = None
+    type: str | None = None
+    queue: int | None = None
+    participants: list[Participants] = msgspec.field(default_factory=list)
+
+    QUEUES: ClassVar[dict[int, str]] = {
         0: 'Custom Game',
         72: 'Howling Abyss - Snowdown Showdown (1v1)',
         73: 'Howling Abyss - Snowdown Showdown (2v2)',
@@ -61,13 +86,6 @@ class Game:
         1070: 'Crash Site - Odyssey Extraction: Onslaught'
     }
 
-    def __init__(self, data):
-        self.id = data.get('gameId')
-        self.map = data.get('mapId')
-        self.type = data.get('gameType')
-        self.queue = data.get('gameQueueConfigId')
-        self.participants = data.get('participants')
-
     @property
     def mode(self) -> str | None:
         if self.queue in self.QUEUES:
@@ -76,38 +94,31 @@ class Game:
         return None
 
 
-@dataclass
-class League:
-    __slots__ = (
-        'name',
-        'queue',
-        'tier',
-        'rank',
-        'wins',
-        'losses',
-        'points'
-    )
-
-    QUEUES = {
+class League(
+    msgspec.Struct,
+    rename={
+        'name': 'leagueName',
+        'queue': 'queueType',
+        'points': 'leaguePoints'
+    }
+):
+    name: str | None = None
+    queue: str | None = None
+    tier: str = ''
+    rank: str = ''
+    wins: int = 0
+    losses: int = 0
+    points: int = 0
+
+    QUEUES: ClassVar[dict[str, str]] = {
         'RANKED_SOLO_5x5': 'Solo Queue (5v5)',
         'RANKED_FLEX_SR': 'Flex Queue (5x5)',
         'RANKED_FLEX_TT': 'Flex Queue (3x3)',
         'RANKED_TFT_DOUBLE_UP': 'Teamfight Tactics (Double Up)',
     }
 
-    def __init__(self, data):
-        self.name = data.get('leagueName')
-        self.queue = data.get('queueType')
-
-        if data.get('tier'):
-            self.tier = data.get('tier').title()
-
-        if data.get('rank'):
-            self.rank = data.get('rank')
-
-        self.wins = data.get('wins')
-        self.losses = data.get('losses')
-        self.points = data.get('leaguePoints')
+    def __post_init__(self):
+        self.tier = self.tier.title()
 
     def __repr__(self):
         if self.queue == 'RANKED_TFT_PAIRS':
@@ -125,48 +136,23 @@ class League:
             return self.QUEUES[self.queue]
 
 
-@dataclass
-class Mastery:
-    __slots__ = (
-        'id',
-        'level',
-        'points'
-    )
-
-    def __init__(self, data):
-        self.id = data.get('championId')
-        self.level = data.get('championLevel')
-        self.points = data.get('championPoints')
+class Mastery(
+    msgspec.Struct,
+    rename={
+        'id': 'championId',
+        'level': 'championLevel',
+        'points': 'championPoints'
+    }
+):
+    id: int | None = None
+    level: int = 0
+    points: int = 0
 
     def __repr__(self):
         return f"Level {self.level} [{self.points:,} Points]"
 
 
-@dataclass
-class Participants:
-    __slots__ = (
-        'id',
-        'name',
-        'team',
-        'champion'
-    )
-
-    def __init__(self, data):
-        self.id = data.get('summonerId')
-        self.name = data.get('summonerName')
-        self.team = data.get('teamId')
-        self.champion = data.get('championId')
-
-
-@dataclass
-class Summoner:
-    __slots__ = (
-        'id',
-        'name',
-        'level'
-    )
-
-    def __init__(self, data):
-        self.id = data.get('id')
-        self.name = data.get('name')
-        self.level = data.get('summonerLevel')
+class Summoner(msgspec.Struct, rename={'level': 'summonerLevel'}):
+    id: str | None = None
+    name: str | None = None
+    level: int = 0
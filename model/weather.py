@@ -1,41 +1,93 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import msgspec
+
 from utilities.format import format_utc
 
 
-@dataclass
-class Forecast:
-    __slots__ = (
-        'city',
-        'country',
-        'conditions',
-        'condition',
-        'description',
-        'temperature',
-        'low_temperature',
-        'high_temperature',
-        'wind',
-        'humidity',
-        'pressure',
-        'observed'
-    )
-
-    def __init__(self, data):
-        self.city = data.get('name')
-        self.country = data.get('sys').get('country')
-        self.conditions = data.get('weather')
-        self.temperature = data.get('main').get('temp')
-        self.low_temperature = data.get('main').get('temp_min')
-        self.high_temperature = data.get('main').get('temp_max')
-        self.wind = data.get('wind').get('speed')
-        self.humidity = data.get('main').get('humidity')
-        self.pressure = data.get('main').get('pressure')
-        self.observed = data.get('dt')
-
-        for condition in self.conditions:
-            self.condition = condition.get('main').title()
-            self.description = condition.get('description').title()
+# The nested objects of OpenWeatherMap are decoded into their own
+# structures, and exposed as flat properties by the forecast.
+
+class System(msgspec.Struct):
+    country: str = ''
+
+
+class Condition(msgspec.Struct):
+    main: str = ''
+    description: str = ''
+
+
+class Measurement(msgspec.Struct):
+    temp: float = 0.0
+    temp_min: float = 0.0
+    temp_max: float = 0.0
+    humidity: int = 0
+    pressure: int = 0
+
+
+class Wind(msgspec.Struct):
+    speed: float = 0.0
+
+
+class Forecast(
+    msgspec.Struct,
+    rename={
+        'city': 'name',
+        'system': 'sys',
+        'conditions': 'weather',
+        'measurement': 'main',
+        'air': 'wind',
+        'observed': 'dt'
+    }
+):
+    city: str = ''
+    system: System = msgspec.field(default_factory=System)
+    conditions: list[Condition] = msgspec.field(default_factory=list)
+    measurement: Measurement = msgspec.field(default_factory=Measurement)
+    air: Wind = msgspec.field(default_factory=Wind)
+    observed: int = 0
+
+    @property
+    def country(self) -> str:
+        return self.system.country
+
+    @property
+    def condition(self) -> str:
+        if not self.conditions:
+            return ''
+
+        return self.conditions[-1].main.title()
+
+    @property
+    def description(self) -> str:
+        if not self.conditions:
+            return ''
+
+        return self.conditions[-1].description.title()
+
+    @property
+    def temperature(self) -> float:
+        return self.measurement.temp
+
+    @property
+    def low_temperature(self) -> float:
+        return self.measurement.temp_min
+
+    @property
+    def high_temperature(self) -> float:
+        return self.measurement.temp_max
+
+    @property
+    def wind(self) -> float:
+        return self.air.speed
+
+    @property
+    def humidity(self) -> int:
+        return self.measurement.humidity
+
+    @property
+    def pressure(self) -> int:
+        return self.measurement.pressure
 
     @property
     def fahrenheit(self) -> float:
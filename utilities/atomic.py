@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import tempfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+
+def open_temporary(path: Path) -> tuple[BinaryIO, Path]:
+    """
+    A function that opens a unique temporary file beside a path, so
+    concurrent writes of the same path never share a file.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    descriptor, temporary = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix='.tmp'
+    )
+
+    return (os.fdopen(descriptor, 'wb'), Path(temporary))
+
+
+def commit(file: BinaryIO, temporary: Path, path: Path) -> None:
+    file.flush()
+    os.fsync(file.fileno())
+    file.close()
+
+    os.replace(temporary, path)
+
+
+def discard(file: BinaryIO, temporary: Path) -> None:
+    file.close()
+    temporary.unlink(missing_ok=True)
+
+
+def write(path: Path, buffer: bytes) -> None:
+    """
+    A function that writes a file to a temporary path, then renames it
+    into place, so a reader never sees a partially written file.
+    """
+
+    file, temporary = open_temporary(path)
+
+    try:
+        file.write(buffer)
+        commit(file, temporary, path)
+    except BaseException:
+        discard(file, temporary)
+        raise
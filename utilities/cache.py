@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from collections import OrderedDict
+from functools import wraps
+from typing import TYPE_CHECKING
+from utilities.flight import SingleFlight
+from utilities.request import RequestError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+    from typing_extensions import Any
+
+
+log = logging.getLogger(__name__)
+
+
+class Entry:
+    __slots__ = (
+        'value',
+        'error',
+        'expires'
+    )
+
+    def __init__(
+        self,
+        value: Any,
+        expires: float,
+        error: Exception | None = None
+    ):
+        self.value = value
+        self.error = error
+        self.expires = expires
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+
+class TTLCache:
+    """
+    A least recently used cache, where each entry expires after its
+    own time-to-live.
+    """
+
+    def __init__(self, name: str, maximum: int = 1024):
+        self.name = name
+        self.maximum = maximum
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Entry | None:
+        entry = self.entries.get(key)
+
+        if entry is None or entry.expired:
+            self.entries.pop(key, None)
+            self.misses = self.misses + 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits = self.hits + 1
+        return entry
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float,
+        error: Exception | None = None
+    ) -> None:
+        expires = time.monotonic() + ttl
+
+        self.entries[key] = Entry(value, expires, error)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maximum:
+            self.entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def statistics(self) -> dict[str, int]:
+        return {
+            'size': len(self.entries),
+            'maximum': self.maximum,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class StaleCache(TTLCache):
+    """
+    A cache that keeps an entry after it expires. A stale entry is
+    served immediately while it is refreshed in the background, and is
+    kept if the refresh fails, so the last good value outlives an
+    outage.
+    """
+
+    def __init__(self, name: str, maximum: int = 1024):
+        super().__init__(name, maximum)
+        self.stale = 0
+        self.failures = 0
+        self.flights = SingleFlight()
+        self.tasks = set()
+
+    async def refresh(
+        self,
+        key: Hashable,
+        ttl: float,
+        func: Callable[..., Awaitable[Any]],
+        *args
+    ) -> Any:
+        value = await self.flights.run(key, func, *args)
+        self.set(key, value, ttl)
+        return value
+
+    def revalidate(
+        self,
+        key: Hashable,
+        ttl: float,
+        func: Callable[..., Awaitable[Any]],
+        *args
+    ) -> None:
+        if key in self.flights.flights:
+            return
+
+        task = asyncio.create_task(
+            self.refresh(key, ttl, func, *args)
+        )
+
+        self.tasks.add(task)
+        task.add_done_callback(self.complete)
+
+    def complete(self, task: asyncio.Task) -> None:
+        self.tasks.discard(task)
+
+        if task.cancelled():
+            return
+
+        exception = task.exception()
+
+        if exception is not None:
+            self.failures = self.failures + 1
+            log.warning(f"The {self.name} cache could not be refreshed: {exception}")
+
+    async def fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        func: Callable[..., Awaitable[Any]],
+        *args
+    ) -> Any:
+        """
+        A function that returns the cached value of a key, and only
+        waits for the function to be called if there is no value at
+        all.
+        """
+
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.misses = self.misses + 1
+            return await self.refresh(key, ttl, func, *args)
+
+        self.entries.move_to_end(key)
+
+        if entry.expired:
+            self.stale = self.stale + 1
+            self.revalidate(key, ttl, func, *args)
+        else:
+            self.hits = self.hits + 1
+
+        return entry.value
+
+    def statistics(self) -> dict[str, int]:
+        return {
+            **super().statistics(),
+            'stale': self.stale,
+            'failures': self.failures,
+        }
+
+
+def cached(
+    cache: TTLCache,
+    ttl: float,
+    negative: float = 0,
+    key: Callable[..., Hashable] | None = None
+) -> Callable:
+    """
+    A decorator to cache the result of a coroutine. A request for
+    something that does not exist is cached for the negative
+    time-to-live, and raised again on a hit.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            identifier = (
+                key(*args, **kwargs)
+                if key is not None
+                else (args, tuple(sorted(kwargs.items())))
+            )
+
+            entry = cache.get(identifier)
+
+            if entry is not None:
+                if entry.error is not None:
+                    raise entry.error
+
+                return entry.value
+
+            try:
+                value = await func(*args, **kwargs)
+            except RequestError as exception:
+                if negative and exception.status == 404:
+                    cache.set(identifier, None, negative, error=exception)
+
+                raise
+
+            cache.set(identifier, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
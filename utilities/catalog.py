@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+
+from database.engine import lol
+from database.lol import (
+    Ability,
+    Champion,
+    Item,
+    Rune,
+    Spell,
+    Version
+)
+from rapidfuzz import process
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing_extensions import Any
+
+
+log = logging.getLogger(__name__)
+
+
+# Common abbreviations that a fuzzy match would never resolve, mapped
+# to the name of the champion or spell they refer to.
+
+CHAMPION_ALIASES = {
+    'asol': 'Aurelion Sol',
+    'blitz': 'Blitzcrank',
+    'cait': 'Caitlyn',
+    'cass': 'Cassiopeia',
+    'cho': "Cho'Gath",
+    'ez': 'Ezreal',
+    'fiddle': 'Fiddlesticks',
+    'gp': 'Gangplank',
+    'heimer': 'Heimerdinger',
+    'j4': 'Jarvan IV',
+    'kass': 'Kassadin',
+    'kat': 'Katarina',
+    'kog': "Kog'Maw",
+    'lb': 'LeBlanc',
+    'leo': 'Leona',
+    'malph': 'Malphite',
+    'mf': 'Miss Fortune',
+    'morg': 'Morgana',
+    'mord': 'Mordekaiser',
+    'mundo': 'Dr. Mundo',
+    'nunu': 'Nunu & Willump',
+    'naut': 'Nautilus',
+    'noc': 'Nocturne',
+    'ori': 'Orianna',
+    'pant': 'Pantheon',
+    'rek': "Rek'Sai",
+    'sej': 'Sejuani',
+    'tf': 'Twisted Fate',
+    'trist': 'Tristana',
+    'trynd': 'Tryndamere',
+    'vel': "Vel'Koz",
+    'voli': 'Volibear',
+    'ww': 'Warwick',
+    'xin': 'Xin Zhao',
+    'yi': 'Master Yi',
+    'yas': 'Yasuo',
+}
+
+SPELL_ALIASES = {
+    'exh': 'Exhaust',
+    'ign': 'Ignite',
+    'tp': 'Teleport',
+}
+
+
+def normalize(string: str) -> str:
+    """
+    A function to reduce a name to lowercase alphanumerical characters,
+    so "Kai'Sa", "kaisa" and "Kai Sa" share the same key.
+    """
+
+    pattern = re.compile('[^a-z0-9]+')
+    return pattern.sub('', string.lower())
+
+
+class Index:
+    """
+    A search index over a set of records. Exact and alias matches are
+    answered from a dictionary, and fuzzy matching is only used as a
+    fallback.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[Any],
+        aliases: dict[str, str],
+        *keys: str
+    ):
+        self.table = {}
+
+        for record in records:
+            for key in ('name', *keys):
+                value = getattr(record, key)
+
+                if value:
+                    self.table.setdefault(normalize(value), record)
+
+        for alias, name in aliases.items():
+            record = self.table.get(normalize(name))
+
+            if record is not None:
+                self.table.setdefault(normalize(alias), record)
+
+        self.choices = list(self.table)
+
+    def search(self, query: str) -> Any | None:
+        query = normalize(query)
+
+        if not query or not self.choices:
+            return None
+
+        record = self.table.get(query)
+
+        if record is not None:
+            return record
+
+        match, _, _ = process.extractOne(
+            query,
+            self.choices,
+            processor=None
+        )
+
+        return self.table.get(match)
+
+
+class Snapshot:
+    """
+    An immutable view of the static League of Legends data for a single
+    patch version.
+    """
+
+    def __init__(
+        self,
+        version: Version,
+        champions: list[Champion],
+        abilities: list[Ability],
+        items: list[Item],
+        runes: list[Rune],
+        spells: list[Spell]
+    ):
+        self.version = version
+
+        self.champion = {champion.id: champion for champion in champions}
+        self.champion_name = {champion.name: champion for champion in champions}
+        self.ability = {ability.champion_id: ability for ability in abilities}
+        self.item = {item.id: item for item in items}
+        self.rune = {rune.id: rune for rune in runes}
+        self.spell = {spell.id: spell for spell in spells}
+        self.spell_name = {spell.name: spell for spell in spells}
+
+        self.champion_index = Index(champions, CHAMPION_ALIASES, 'key')
+        self.spell_index = Index(spells, SPELL_ALIASES, 'id')
+
+    @property
+    def identifier(self) -> dict[str, Any]:
+        if self.version is None:
+            return {}
+
+        return self.version.to_dict()
+
+
+class Catalog:
+    """
+    A process-wide cache of the champion, ability, item, rune, spell
+    and version tables. The tables only change on patch day, so they
+    are loaded once, and reloaded when the version changes.
+    """
+
+    def __init__(self):
+        self.listeners = []
+        self.lock = asyncio.Lock()
+        self.snapshot = None
+
+    def subscribe(self, listener: Callable[[Snapshot], None]) -> None:
+        """
+        A function that registers a listener, which is called with the
+        new snapshot whenever the catalog is reloaded for a new patch.
+        """
+
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Snapshot], None]) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    async def get_version(self) -> Version:
+        return (
+            await Version
+            .query
+            .where(Version.id == 1)
+            .gino
+            .first()
+        )
+
+    async def get(self) -> Snapshot:
+        snapshot = self.snapshot
+
+        if snapshot is None:
+            snapshot = await self.load()
+
+        return snapshot
+
+    async def load(self) -> Snapshot:
+        async with self.lock:
+            # Every table is read from the same snapshot of the database,
+            # so an ingest that commits in the middle of a load can not
+            # mix two patches.
+            async with lol.transaction(
+                isolation='repeatable_read',
+                readonly=True
+            ):
+                version = await self.get_version()
+
+                if self.snapshot is not None:
+                    current = self.snapshot.identifier
+
+                    if version is not None and version.to_dict() == current:
+                        return self.snapshot
+
+                snapshot = Snapshot(
+                    version,
+                    await Champion.query.gino.all(),
+                    await Ability.query.gino.all(),
+                    await Item.query.gino.all(),
+                    await Rune.query.gino.all(),
+                    await Spell.query.gino.all()
+                )
+
+            previous = self.snapshot
+
+            # The snapshot is swapped in a single assignment, so a
+            # lookup never sees a partially loaded patch.
+            self.snapshot = snapshot
+
+            if previous is not None:
+                for listener in self.listeners:
+                    listener(snapshot)
+
+            patch = snapshot.identifier.get('champion')
+
+            message = f"The catalog was loaded for {patch}."
+            log.info(message)
+
+            return snapshot
+
+    async def watch(self, interval: int) -> None:
+        """
+        A function that periodically checks the version, and reloads
+        the catalog when a new patch is found.
+        """
+
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                await self.load()
+            except Exception as exception:
+                log.warning(exception)
+
+
+catalog = Catalog()
@@ -0,0 +1,651 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+
+from database.engine import lol
+from database.lol import (
+    Ability,
+    Champion,
+    Item,
+    Rune,
+    Spell,
+    Version
+)
+from datetime import datetime
+from imaging.rune import grayscale
+from pathlib import Path, PurePosixPath
+from sqlalchemy import String
+from typing import TYPE_CHECKING
+from utilities.atomic import write
+from utilities.request import RequestError, error_handler, fetch
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from collections.abc import Iterator
+    from gino.crud import CRUDModel
+    from typing_extensions import Any
+    from utilities.executor import Executor
+
+
+log = logging.getLogger(__name__)
+
+
+ASSET = 'https://ddragon.leagueoflegends.com'
+REALM = f"{ASSET}/realms/na.json"
+
+MANIFEST = 'manifest.json'
+
+# The files that are read from a Data Dragon directory, or from the
+# data of a version on the CDN.
+
+FILES = {
+    'champion': 'championFull.json',
+    'item': 'item.json',
+    'rune': 'runesReforged.json',
+    'spell': 'summoner.json',
+}
+
+
+def load(path: Path) -> Any:
+    with path.open('r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+class Source:
+    """
+    A source of Data Dragon JSON, which is either a local directory
+    or the Data Dragon CDN.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        executor: Executor,
+        location: str | None = None,
+        language: str = 'en_US'
+    ):
+        self.session = session
+        self.executor = executor
+        self.location = location
+        self.language = language
+        self.realm = None
+
+    @property
+    def is_local(self) -> bool:
+        return (
+            self.location is not None and
+            not self.location.startswith(('http://', 'https://'))
+        )
+
+    async def read(self, filename: str) -> dict[str, Any]:
+        # A file of a local directory is several megabytes, so it is
+        # read and parsed by a thread.
+        if self.is_local:
+            path = Path(self.location).joinpath(filename)
+            return await self.executor.io(load, path)
+
+        if self.location is None:
+            version = self.realm.get('n').get('champion')
+            base = f"{ASSET}/cdn/{version}/data/{self.language}"
+        else:
+            base = self.location.rstrip('/')
+
+        return await fetch(self.session, f"{base}/{filename}")
+
+    async def get_realm(self) -> dict[str, Any]:
+        """
+        A function that returns the realm, which holds the version of
+        each type of data. A local directory or URL must include a copy
+        of it as realm.json, so its versions match its data. Only the
+        latest patch is read from the realm of the CDN.
+        """
+
+        if self.realm is None:
+            if self.location is None:
+                realm = await fetch(self.session, REALM)
+            elif self.is_local:
+                path = Path(self.location).joinpath('realm.json')
+                realm = await self.executor.io(load, path)
+            else:
+                url = f"{self.location.rstrip('/')}/realm.json"
+                realm = await fetch(self.session, url)
+
+            if not isinstance(realm, dict) or not isinstance(realm.get('n'), dict):
+                message = 'The realm does not include the version of each type.'
+                raise ValueError(message)
+
+            self.realm = realm
+
+        return self.realm
+
+
+def clip(model: CRUDModel, row: dict[str, Any]) -> tuple[Any, ...]:
+    """
+    A function to order a row by the model's columns, and shorten any
+    string that is longer than its column allows.
+    """
+
+    record = []
+
+    for column in model.__table__.columns:
+        value = row.get(column.name)
+
+        length = getattr(column.type, 'length', None)
+
+        if isinstance(column.type, String) and length and isinstance(value, str):
+            value = value[:length]
+
+        record.append(value)
+
+    return tuple(record)
+
+
+def get_records(
+    model: CRUDModel,
+    rows: Iterator[dict[str, Any]]
+) -> list[tuple[Any, ...]]:
+    return [clip(model, row) for row in rows]
+
+
+def get_champions(
+    data: dict[str, Any],
+    now: datetime
+) -> Iterator[dict[str, Any]]:
+    for champion in data.get('data').values():
+        information = champion.get('info')
+        statistics = champion.get('stats')
+        tags = champion.get('tags')
+
+        yield {
+            'id': champion.get('key'),
+            'name': champion.get('name'),
+            'key': champion.get('id'),
+            'title': champion.get('title'),
+            'blurb': champion.get('blurb'),
+            'attack_information': information.get('attack'),
+            'defense_information': information.get('defense'),
+            'magic_information': information.get('magic'),
+            'difficulty_information': information.get('difficulty'),
+            'full_image': champion.get('image').get('full'),
+            'champion_class': tags[0] if tags else None,
+            'resource': champion.get('partype'),
+            'health': statistics.get('hp'),
+            'health_per_level': statistics.get('hpperlevel'),
+            'mana': statistics.get('mp'),
+            'mana_per_level': statistics.get('mpperlevel'),
+            'movement_speed': statistics.get('movespeed'),
+            'armor': statistics.get('armor'),
+            'armor_per_level': statistics.get('armorperlevel'),
+            'spellblock': statistics.get('spellblock'),
+            'spellblock_per_level': statistics.get('spellblockperlevel'),
+            'attack_range': statistics.get('attackrange'),
+            'health_regeneration': statistics.get('hpregen'),
+            'health_regeneration_per_level': statistics.get('hpregenperlevel'),
+            'mana_regeneration': statistics.get('mpregen'),
+            'mana_regeneration_per_level': statistics.get('mpregenperlevel'),
+            'critical_strike': statistics.get('crit'),
+            'critical_strike_per_level': statistics.get('critperlevel'),
+            'attack_damage': statistics.get('attackdamage'),
+            'attack_damage_per_level': statistics.get('attackdamageperlevel'),
+            'attack_speed': statistics.get('attackspeed'),
+            'attack_speed_per_level': statistics.get('attackspeedperlevel'),
+            'created_at': now,
+            'updated_at': now,
+        }
+
+
+def get_abilities(
+    data: dict[str, Any],
+    now: datetime
+) -> Iterator[dict[str, Any]]:
+    for champion in data.get('data').values():
+        passive = champion.get('passive')
+
+        ability = {
+            'champion_id': champion.get('key'),
+            'p_name': passive.get('name'),
+            'p_description': passive.get('description'),
+            'p_image': passive.get('image').get('full'),
+            'created_at': now,
+            'updated_at': now,
+        }
+
+        # A champion always has four spells, and a patch that does not
+        # is rejected, rather than leaving an ability without an image.
+        for prefix, spell in zip('qwer', champion.get('spells'), strict=True):
+            ability[f"{prefix}_id"] = spell.get('id')
+            ability[f"{prefix}_name"] = spell.get('name')
+            ability[f"{prefix}_description"] = spell.get('description')
+            ability[f"{prefix}_image"] = spell.get('image').get('full')
+
+        yield ability
+
+
+def get_items(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    for identifier, item in data.get('data').items():
+        gold = item.get('gold')
+
+        yield {
+            'id': identifier,
+            'name': item.get('name'),
+            'description': item.get('description'),
+            'ingredients': item.get('from'),
+            'gold_base': gold.get('base'),
+            'gold_total': gold.get('total'),
+            'tags': item.get('tags'),
+            'full_image': item.get('image').get('full'),
+        }
+
+
+def get_runes(data: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    for tree in data:
+        yield {
+            'id': str(tree.get('id')),
+            'key': tree.get('key'),
+            'name': tree.get('name'),
+            'icon': tree.get('icon'),
+            'parent': None,
+            'keystone': False,
+        }
+
+        for index, slot in enumerate(tree.get('slots')):
+            for rune in slot.get('runes'):
+                yield {
+                    'id': str(rune.get('id')),
+                    'key': rune.get('key'),
+                    'name': rune.get('name'),
+                    'icon': rune.get('icon'),
+                    'parent': str(tree.get('id')),
+                    'keystone': index == 0,
+                }
+
+
+def first(values: list[Any] | None) -> Any:
+    if not values:
+        return None
+
+    return int(values[0])
+
+
+def get_spells(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    for spell in data.get('data').values():
+        yield {
+            'id': spell.get('id'),
+            'key': spell.get('key'),
+            'name': spell.get('name'),
+            'description': spell.get('description'),
+            'maximum_rank': spell.get('maxrank'),
+            'cooldown': first(spell.get('cooldown')),
+            'cost': first(spell.get('cost')),
+            'cost_type': spell.get('costType'),
+            'maximum_ammo': spell.get('maxammo'),
+            'spell_range': first(spell.get('range')),
+            'full_image': spell.get('image').get('full'),
+            'resource': spell.get('resource'),
+            'level': spell.get('summonerLevel'),
+        }
+
+
+def get_version(realm: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield {'id': 1, **realm.get('n')}
+
+
+async def merge(
+    connection: Any,
+    model: CRUDModel,
+    records: list[tuple[Any, ...]],
+    prune: bool = False
+) -> None:
+    """
+    A function that copies the records into a staging table, then
+    upserts them into the table. If prune is set, any row that is no
+    longer in Data Dragon is deleted.
+    """
+
+    table = model.__tablename__
+    staging = f"staging_{table}"
+
+    columns = [column.name for column in model.__table__.columns]
+    keys = [column.name for column in model.__table__.primary_key.columns]
+
+    await connection.execute(
+        f"CREATE TEMPORARY TABLE {staging} "
+        f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+
+    await connection.copy_records_to_table(
+        staging,
+        records=records,
+        columns=columns
+    )
+
+    update = ', '.join(
+        f"{column} = EXCLUDED.{column}"
+        for column in columns
+        if column not in keys and column != 'created_at'
+    )
+
+    await connection.execute(
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"SELECT {', '.join(columns)} FROM {staging} "
+        f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {update}"
+    )
+
+    if prune:
+        await connection.execute(
+            f"DELETE FROM {table} WHERE ({', '.join(keys)}) NOT IN "
+            f"(SELECT {', '.join(keys)} FROM {staging})"
+        )
+
+
+async def ingest(
+    session: ClientSession,
+    executor: Executor,
+    location: str | None = None
+) -> dict[str, int]:
+    """
+    A function that loads a patch from Data Dragon into the lol
+    database. Every table, and the version, is replaced in a single
+    transaction, so a reader never sees a partially loaded patch.
+    """
+
+    source = Source(session, executor, location)
+    realm = await source.get_realm()
+
+    champions = await source.read(FILES['champion'])
+    items = await source.read(FILES['item'])
+    runes = await source.read(FILES['rune'])
+    spells = await source.read(FILES['spell'])
+
+    now = datetime.now()
+
+    # The champions are merged before their abilities, which reference
+    # them, and the version is bumped last.
+    tables = [
+        (Champion, get_champions(champions, now), False),
+        (Ability, get_abilities(champions, now), False),
+        (Item, get_items(items), True),
+        (Rune, get_runes(runes), True),
+        (Spell, get_spells(spells), True),
+        (Version, get_version(realm), False),
+    ]
+
+    # The rows are built and clipped by a thread, before the transaction
+    # is opened.
+    tables = [
+        (model, await executor.io(get_records, model, rows), prune)
+        for model, rows, prune in tables
+    ]
+
+    count = {}
+
+    async with lol.transaction() as transaction:
+        connection = transaction.connection.raw_connection
+
+        for model, records, prune in tables:
+            await merge(connection, model, records, prune=prune)
+
+            count[model.__tablename__] = len(records)
+
+    message = f"Data Dragon {realm.get('n').get('champion')} was ingested."
+    log.info(message)
+
+    return count
+
+
+def get_assets(
+    realm: dict[str, Any],
+    champions: dict[str, Any],
+    items: dict[str, Any],
+    runes: list[dict[str, Any]],
+    spells: dict[str, Any]
+) -> dict[str, str]:
+    """
+    A function that returns the URL of every image, keyed by its path
+    relative to the images/lol directory.
+    """
+
+    version = realm.get('n')
+    assets = {}
+
+    champion = f"{ASSET}/cdn/{version.get('champion')}/img"
+
+    for data in champions.get('data').values():
+        filename = data.get('image').get('full')
+        assets[f"champion/{filename}"] = f"{champion}/champion/{filename}"
+
+        for spell in data.get('spells'):
+            filename = spell.get('image').get('full')
+            assets[f"spell/{filename}"] = f"{champion}/spell/{filename}"
+
+    item = f"{ASSET}/cdn/{version.get('item')}/img/item"
+
+    for data in items.get('data').values():
+        filename = data.get('image').get('full')
+        assets[f"item/{filename}"] = f"{item}/{filename}"
+
+    summoner = f"{ASSET}/cdn/{version.get('summoner')}/img/spell"
+
+    for data in spells.get('data').values():
+        filename = data.get('image').get('full')
+        assets[f"spell/{filename}"] = f"{summoner}/{filename}"
+
+    # The rune icons are not versioned.
+    for data in get_runes(runes):
+        icon = data.get('icon')
+        filename = PurePosixPath(icon).name
+        assets[f"rune/color/{filename}"] = f"{ASSET}/cdn/img/{icon}"
+
+    return assets
+
+
+def read_manifest(directory: Path) -> dict[str, Any]:
+    path = directory.joinpath(MANIFEST)
+
+    if not path.exists():
+        return {'assets': {}}
+
+    with path.open('r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def write_manifest(directory: Path, manifest: dict[str, Any]) -> None:
+    buffer = json.dumps(manifest, indent=4, sort_keys=True).encode('utf-8')
+    write(directory.joinpath(MANIFEST), buffer)
+
+
+@error_handler
+async def get_asset(
+    session: ClientSession,
+    url: str,
+    etag: str | None = None
+) -> tuple[dict[str, Any], bytes] | None:
+    """
+    A function that downloads an asset, unless it is unchanged from the
+    previous ETag. The size of the body is verified against the
+    Content-Length.
+    """
+
+    headers = {'If-None-Match': etag} if etag else {}
+
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            return None
+
+        response.raise_for_status()
+        buffer = await response.read()
+
+        length = response.content_length
+
+        if length is not None and length != len(buffer):
+            message = f"{url} was {len(buffer)} bytes, instead of {length}."
+            raise RequestError(message)
+
+        entry = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'size': len(buffer),
+            'sha256': hashlib.sha256(buffer).hexdigest(),
+        }
+
+        return (entry, buffer)
+
+
+class Sync:
+    """
+    The state of a sync of the images/lol directory: the manifest of
+    the previous sync, the manifest that is being built and the number
+    of assets in each outcome.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        executor: Executor,
+        directory: Path,
+        previous: dict[str, Any],
+        version: dict[str, str],
+        concurrency: int = 8
+    ):
+        self.session = session
+        self.executor = executor
+        self.directory = directory
+        self.previous = previous.get('assets')
+        self.manifest = {'version': version, 'assets': {}}
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+        self.count = {
+            'downloaded': 0,
+            'unchanged': 0,
+            'failed': 0,
+            'removed': 0,
+        }
+
+    def record(self, relative: str, entry: dict[str, Any], outcome: str) -> None:
+        if entry is not None:
+            self.manifest['assets'][relative] = entry
+
+        self.count[outcome] = self.count[outcome] + 1
+
+    async def update(self, relative: str, url: str) -> None:
+        """
+        A function that downloads an asset, unless it is unchanged from
+        the previous sync.
+        """
+
+        entry = self.previous.get(relative)
+        path = self.directory.joinpath(relative)
+
+        exists = entry is not None and await self.executor.io(path.exists)
+
+        if exists and entry.get('url') == url:
+            self.record(relative, entry, 'unchanged')
+            return
+
+        etag = entry.get('etag') if exists else None
+
+        try:
+            async with self.semaphore:
+                result = await get_asset(self.session, url, etag)
+        except RequestError as exception:
+            log.warning(exception)
+            self.record(relative, entry if exists else None, 'failed')
+            return
+
+        if result is None:
+            self.record(relative, {**entry, 'url': url}, 'unchanged')
+            return
+
+        entry, buffer = result
+        await self.executor.io(write, path, buffer)
+
+        self.record(relative, entry, 'downloaded')
+
+    async def grayscale(self) -> None:
+        """
+        A function that creates the grayscale variant of every rune
+        icon that has changed, for the runes that were not selected.
+        """
+
+        for relative, entry in self.manifest['assets'].items():
+            if not relative.startswith('rune/color/'):
+                continue
+
+            color = self.directory.joinpath(relative)
+            gray = self.directory.joinpath('rune/grayscale', color.name)
+
+            changed = self.previous.get(relative) != entry
+
+            if changed or not await self.executor.io(gray.exists):
+                await self.executor.render(grayscale, color, gray)
+
+    async def remove(self) -> None:
+        """
+        A function that deletes every asset that is no longer part of
+        the patch.
+        """
+
+        for relative in self.previous:
+            if relative in self.manifest['assets']:
+                continue
+
+            path = self.directory.joinpath(relative)
+            await self.executor.io(path.unlink, missing_ok=True)
+
+            self.count['removed'] = self.count['removed'] + 1
+
+
+async def sync(
+    session: ClientSession,
+    executor: Executor,
+    directory: Path,
+    location: str | None = None,
+    concurrency: int = 8
+) -> dict[str, int]:
+    """
+    A function that brings the images/lol directory up to date with a
+    patch. Only the assets that are new, or have changed since the
+    previous manifest, are downloaded.
+    """
+
+    source = Source(session, executor, location)
+    realm = await source.get_realm()
+
+    assets = get_assets(
+        realm,
+        await source.read(FILES['champion']),
+        await source.read(FILES['item']),
+        await source.read(FILES['rune']),
+        await source.read(FILES['spell'])
+    )
+
+    previous = await executor.io(read_manifest, directory)
+
+    state = Sync(
+        session,
+        executor,
+        directory,
+        previous,
+        realm.get('n'),
+        concurrency
+    )
+
+    await asyncio.gather(
+        *[
+            state.update(relative, url)
+            for relative, url in assets.items()
+        ]
+    )
+
+    await state.grayscale()
+    await state.remove()
+
+    await executor.io(write_manifest, directory, state.manifest)
+
+    message = f"The assets were synced to {realm.get('n').get('champion')}."
+    log.info(message)
+
+    return state.count
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import statistics
+import time
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from imaging.rune import atlas
+from imaging.skill import preload, set_font
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor as BaseExecutor
+    from typing_extensions import Any
+
+
+def initialize(font: str | None) -> None:
+    """
+    A function that is run once by each rendering process, so the rune
+    icons and skill badges are decoded before the first render.
+    """
+
+    set_font(font)
+    atlas.load()
+    preload()
+
+
+class Metric:
+    """
+    The queue depth and latency of the tasks submitted to an executor.
+    """
+
+    def __init__(self, size: int = 256):
+        self.pending = 0
+        self.completed = 0
+        self.latency = deque(maxlen=size)
+
+    def statistics(self) -> dict[str, float]:
+        latency = sorted(self.latency)
+
+        if latency:
+            p50 = latency[len(latency) // 2]
+            p99 = latency[min(len(latency) - 1, int(len(latency) * 0.99))]
+            mean = statistics.fmean(latency)
+        else:
+            p50 = p99 = mean = 0.0
+
+        return {
+            'pending': self.pending,
+            'completed': self.completed,
+            'mean': mean,
+            'p50': p50,
+            'p99': p99,
+        }
+
+
+class Executor:
+    """
+    A process pool for CPU-bound rendering, so it never competes with
+    the event loop for the GIL, and a thread pool for blocking file and
+    network work.
+    """
+
+    def __init__(
+        self,
+        processes: int = 2,
+        threads: int = 4,
+        font: str | None = None
+    ):
+        self.processes = processes
+        self.font = font
+        self.process = self.create_process_pool()
+
+        self.thread = ThreadPoolExecutor(
+            max_workers=threads,
+            thread_name_prefix='viking'
+        )
+
+        self.metrics = {
+            'process': Metric(),
+            'thread': Metric(),
+        }
+
+    def create_process_pool(self) -> ProcessPoolExecutor:
+        # A forked process would inherit the event loop and its
+        # threads, so each worker is spawned instead.
+        context = multiprocessing.get_context('spawn')
+
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=context,
+            initializer=initialize,
+            initargs=(self.font,)
+        )
+
+    def restart(self) -> None:
+        """
+        A function that replaces the process pool, so the new workers
+        load the icons of the current patch. A render that was already
+        submitted finishes on the previous workers.
+        """
+
+        previous = self.process
+        self.process = self.create_process_pool()
+        previous.shutdown(wait=False)
+
+    async def submit(
+        self,
+        executor: BaseExecutor,
+        metric: Metric,
+        func: Callable[..., Any],
+        *args,
+        **kwargs
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+
+        metric.pending = metric.pending + 1
+
+        try:
+            return await loop.run_in_executor(
+                executor,
+                partial(func, *args, **kwargs)
+            )
+        finally:
+            metric.pending = metric.pending - 1
+            metric.completed = metric.completed + 1
+            metric.latency.append(time.perf_counter() - start)
+
+    async def render(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        A function that runs CPU-bound work in the process pool. The
+        function and its arguments must be picklable.
+        """
+
+        return await self.submit(
+            self.process,
+            self.metrics['process'],
+            func,
+            *args,
+            **kwargs
+        )
+
+    async def io(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        A function that runs blocking file or network work in the
+        thread pool.
+        """
+
+        return await self.submit(
+            self.thread,
+            self.metrics['thread'],
+            func,
+            *args,
+            **kwargs
+        )
+
+    def statistics(self) -> dict[str, dict[str, float]]:
+        return {
+            name: metric.statistics()
+            for name, metric in self.metrics.items()
+        }
+
+    def shutdown(self) -> None:
+        self.process.shutdown(wait=False, cancel_futures=True)
+        self.thread.shutdown(wait=False, cancel_futures=True)
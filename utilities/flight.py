@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+    from typing_extensions import Any
+
+
+class SingleFlight:
+    """
+    A function call that is in progress is shared by every caller with
+    the same key, instead of being made again.
+    """
+
+    def __init__(self):
+        self.flights = {}
+        self.coalesced = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        **kwargs
+    ) -> Any:
+        task = self.flights.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self.flights[key] = task
+
+            task.add_done_callback(
+                lambda _: self.flights.pop(key, None)
+            )
+        else:
+            self.coalesced = self.coalesced + 1
+
+        # A caller that is cancelled must not cancel the call for every
+        # other caller.
+        return await asyncio.shield(task)
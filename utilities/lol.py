@@ -1,314 +1,569 @@
 from __future__ import annotations
 
-from database.lol import (
-    Ability,
-    Champion,
-    Item,
-    OPGGKRARAM,
-    Rune,
-    Spell,
-    Version
-)
+from database.lol import Build, SummonerIdentifier
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from model.lol import (
     Game,
     League,
     Mastery,
-    Participants,
     Summoner
 )
-from rapidfuzz import process
+from sqlalchemy.dialects.postgresql import insert
 from typing import TYPE_CHECKING
-from utilities.format import alphabet, format_list
+from utilities.cache import cached, StaleCache, TTLCache
+from utilities.catalog import catalog
+from utilities.flight import SingleFlight
+from utilities.format import format_list
+from utilities.ratelimit import RateLimiter
 from utilities.request import fetch
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
-    from sqlalchemy.engine.result import RowProxy
+    from database.lol import Champion, Spell
     from typing_extensions import Any
 
 
 BASE = 'https://na1.api.riotgames.com/lol'
 ASSET = 'https://ddragon.leagueoflegends.com'
 
+# The regions and modes of the build store, and the build that is used
+# when neither is specified.
+
+REGIONS = ('kr', 'na')
+MODES = ('aram', 'normal')
+
+REGION = 'kr'
+MODE = 'aram'
+
+
+limiter = RateLimiter()
+
+# The time-to-live, in seconds, of each Riot endpoint. A summoner that
+# does not exist is remembered for a shorter time.
+
+SUMMONER_TTL = 600
+LEAGUE_TTL = 120
+MASTERY_TTL = 300
+GAME_TTL = 120
+BUILD_TTL = 3600
+NEGATIVE_TTL = 60
+
+summoner_cache = TTLCache('summoner', maximum=512)
+league_cache = TTLCache('league', maximum=512)
+mastery_cache = TTLCache('mastery', maximum=256)
+build_cache = TTLCache('build', maximum=1024)
+
+# An active game is cached by its game ID, and each participant's
+# summoner ID points to the game, so a lookup of anyone in a known game
+# is served from memory.
+
+game_cache = TTLCache('game', maximum=64)
+participant_cache = TTLCache('participant', maximum=640)
+spectator = SingleFlight()
+
+# A stored summoner ID is trusted for this long, before the summoner
+# is looked up again in case the name has changed hands.
+
+IDENTIFIER_TTL = timedelta(days=7)
+
+# The recommended items of a champion are kept for each patch. After
+# the time-to-live, the items are still served while they are refreshed,
+# and for as long as the endpoint is unavailable.
+
+ITEMSET_TTL = 3600
+
+itemset_cache = StaleCache('itemset', maximum=256)
+
+
+def normalize_summoner_name(summoner_name: str) -> str:
+    """
+    A function to normalize a summoner name, because Riot ignores the
+    case and spaces of a summoner name.
+    """
+
+    return summoner_name.replace(' ', '').lower()
+
+
+async def request(
+    session: ClientSession,
+    url: str,
+    method: str,
+    params: dict[str, Any],
+    model: Any
+) -> Any:
+    return await fetch(
+        session,
+        url,
+        callback=partial(limiter.update, method),
+        before=partial(limiter.acquire, method),
+        model=model,
+        params=params
+    )
+
 
+@cached(
+    mastery_cache,
+    ttl=MASTERY_TTL,
+    negative=NEGATIVE_TTL,
+    key=lambda _, __, identifier: identifier
+)
 async def get_champion_masteries(
     session: ClientSession,
     params: dict[str, Any],
     summoner_id: int
-) -> dict[str, Any]:
+) -> list[Mastery]:
     url = f"{BASE}/champion-mastery/v4/champion-masteries/by-summoner/{summoner_id}"
-    return await fetch(session, url, params=params)
+    return await request(session, url, 'champion-mastery', params, list[Mastery])
 
 
+@cached(
+    summoner_cache,
+    ttl=SUMMONER_TTL,
+    negative=NEGATIVE_TTL,
+    key=lambda _, __, summoner_name: normalize_summoner_name(summoner_name)
+)
 async def get_summoner_account(
     session: ClientSession,
     params: dict[str, Any],
     summoner_name: str
-) -> dict[str, Any]:
+) -> Summoner:
     url = f"{BASE}/summoner/v4/summoners/by-name/{summoner_name}"
-    return await fetch(session, url, params=params)
+    summoner = await request(session, url, 'summoner', params, Summoner)
+
+    await set_summoner_identifiers(
+        [(summoner.name, summoner.id)]
+    )
+
+    return summoner
+
+
+async def get_summoner_identifier(summoner_name: str) -> str | None:
+    """
+    A function that returns the stored summoner ID of a summoner name,
+    if it has been looked up recently.
+    """
+
+    name = normalize_summoner_name(summoner_name)
+
+    row = (
+        await SummonerIdentifier
+        .select('summoner_id', 'updated_at')
+        .where(SummonerIdentifier.name == name)
+        .gino
+        .first()
+    )
+
+    if row is None:
+        return None
+
+    summoner_id, updated_at = row
+
+    if datetime.now(timezone.utc) - updated_at > IDENTIFIER_TTL:
+        return None
+
+    return summoner_id
+
 
+async def set_summoner_identifiers(summoners: list[tuple[str, str]]) -> None:
+    """
+    A function that stores the summoner ID of each summoner name.
+    """
 
+    updated_at = datetime.now(timezone.utc)
+
+    # A name can only appear once in a single upsert.
+    values = {
+        normalize_summoner_name(name): {
+            'name': normalize_summoner_name(name),
+            'summoner_id': summoner_id,
+            'updated_at': updated_at
+        }
+        for name, summoner_id in summoners
+        if name and summoner_id
+    }
+
+    if not values:
+        return
+
+    statement = (
+        insert(SummonerIdentifier)
+        .values(list(values.values()))
+    )
+
+    (
+        await statement
+        .on_conflict_do_update(
+            index_elements=[SummonerIdentifier.name],
+            set_={
+                'summoner_id': statement.excluded.summoner_id,
+                'updated_at': statement.excluded.updated_at
+            }
+        )
+        .gino
+        .status()
+    )
+
+
+@cached(
+    league_cache,
+    ttl=LEAGUE_TTL,
+    negative=NEGATIVE_TTL,
+    key=lambda _, __, identifier: identifier
+)
 async def get_summoner_leagues(
     session: ClientSession,
     params: dict[str, Any],
     summoner_id: int
-) -> dict[str, Any]:
+) -> list[League]:
     url = f"{BASE}/league/v4/entries/by-summoner/{summoner_id}"
-    return await fetch(session, url, params=params)
+    return await request(session, url, 'league', params, list[League])
 
 
 async def get_active_game(
     session: ClientSession,
     params: dict[str, Any],
     summoner_name: str
-) -> dict[str, Any]:
-    summoner = await get_summoner_account(session, params, summoner_name)
-    summoner_id = summoner.get('id')
+) -> Game:
+    name = normalize_summoner_name(summoner_name)
+
+    return await spectator.run(
+        name,
+        get_spectator_game,
+        session,
+        params,
+        summoner_name
+    )
+
+
+async def get_spectator_game(
+    session: ClientSession,
+    params: dict[str, Any],
+    summoner_name: str
+) -> Game:
+    summoner_id = await get_summoner_identifier(summoner_name)
+
+    if summoner_id is None:
+        summoner = await get_summoner_account(session, params, summoner_name)
+        summoner_id = summoner.id
+
+    entry = participant_cache.get(summoner_id)
+
+    if entry is not None:
+        game = game_cache.get(entry.value)
+
+        if game is not None:
+            return game.value
 
     url = f"{BASE}/spectator/v4/active-games/by-summoner/{summoner_id}"
-    return await fetch(session, url, params=params)
+    game = await request(session, url, 'spectator', params, Game)
 
+    game_cache.set(game.id, game, GAME_TTL)
 
-async def get_champion_version() -> float:
-    return (
-        await Version
-        .select('champion')
-        .where(Version.id == 1)
-        .gino
-        .scalar()
+    for participant in game.participants:
+        participant_cache.set(
+            participant.id,
+            game.id,
+            GAME_TTL
+        )
+
+    # Every participant of a game is remembered, so a later lookup of
+    # any of them can skip the summoner endpoint.
+    await set_summoner_identifiers(
+        [
+            (participant.name, participant.id)
+            for participant in game.participants
+        ]
     )
 
+    return game
+
+
+async def get_champion_version() -> float:
+    snapshot = await catalog.get()
+    return snapshot.version.champion
+
 
 async def get_item_version() -> float:
-    return (
-        await Version
-        .select('item')
-        .where(Version.id == 1)
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    return snapshot.version.item
 
 
 async def get_spell_version() -> float:
-    return (
-        await Version
-        .select('summoner')
-        .where(Version.id == 1)
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    return snapshot.version.summoner
+
 
+async def get_build(
+    champion_id: str,
+    region: str = REGION,
+    mode: str = MODE
+) -> Build | None:
+    key = (champion_id, region, mode)
+    entry = build_cache.get(key)
 
-async def get_champion_skill(champion_id: str) -> tuple[list[str], list[str]]:
-    skill = (
-        await OPGGKRARAM
-        .select('skills')
+    if entry is not None:
+        return entry.value
+
+    build = (
+        await Build
+        .query
         .where(
-            OPGGKRARAM.champion_id == champion_id
+            (Build.champion_id == champion_id) &
+            (Build.region == region) &
+            (Build.mode == mode)
         )
         .gino
-        .scalar()
+        .first()
     )
 
-    ability = (
-        await Ability
-        .select('q_image', 'w_image', 'e_image', 'r_image')
-        .where(
-            Ability.champion_id == champion_id
+    build_cache.set(key, build, BUILD_TTL)
+    return build
+
+
+async def set_builds(builds: list[dict[str, Any]]) -> None:
+    """
+    A function that upserts the builds of every champion, region and
+    mode in a single statement.
+    """
+
+    if not builds:
+        return
+
+    now = datetime.now()
+
+    values = [
+        {'created_at': now, 'updated_at': now, **build}
+        for build in builds
+    ]
+
+    statement = (
+        insert(Build)
+        .values(values)
+    )
+
+    (
+        await statement
+        .on_conflict_do_update(
+            index_elements=[Build.champion_id, Build.region, Build.mode],
+            set_={
+                'runes': statement.excluded.runes,
+                'skills': statement.excluded.skills,
+                'items': statement.excluded.items,
+                'updated_at': statement.excluded.updated_at
+            }
         )
         .gino
-        .all()
+        .status()
     )
 
+    build_cache.clear()
+
+
+def parse_build_query(query: str) -> tuple[str | None, str | None, str]:
+    """
+    A function to separate a region and a mode, in any position, from
+    the name of a champion. "kr aram ahri" is ("kr", "aram", "ahri").
+    """
+
+    region = mode = None
+    words = []
+
+    for word in query.split():
+        lowercase = word.lower()
+
+        if region is None and lowercase in REGIONS:
+            region = lowercase
+        elif mode is None and lowercase in MODES:
+            mode = lowercase
+        else:
+            words.append(word)
+
+    return (region, mode, ' '.join(words))
+
+
+async def get_champion_skill(
+    champion_id: str,
+    region: str = REGION,
+    mode: str = MODE
+) -> tuple[list[str], list[str]]:
+    build = await get_build(champion_id, region, mode)
+    skill = build.skills if build is not None else None
+
+    snapshot = await catalog.get()
+    ability = snapshot.ability.get(champion_id)
+
+    # A champion without abilities has nothing to render.
+    if ability is None:
+        return (skill, [])
+
+    ability = [
+        (ability.q_image, ability.w_image, ability.e_image, ability.r_image)
+    ]
+
     return (skill, ability)
 
 
 async def get_champion(champion_name: str) -> str:
-    champion_name = alphabet(champion_name)
-    champion_name = await search_for_champion(champion_name)
-
-    return (
-        await Champion
-        .select('name')
-        .where(
-            Champion.name == champion_name
-        )
-        .gino
-        .scalar()
-    )
+    return await search_for_champion(champion_name)
 
 
 async def get_champion_name(champion_id: str) -> str:
-    return (
-        await Champion
-        .select('name')
-        .where(
-            Champion.id == str(champion_id)
-        )
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    champion = snapshot.champion.get(str(champion_id))
+
+    if champion is None:
+        return None
+
+    return champion.name
 
 
 async def get_champion_key(champion_id: str) -> str:
-    return (
-        await Champion
-        .select('key')
-        .where(
-            Champion.id == str(champion_id)
-        )
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    champion = snapshot.champion.get(str(champion_id))
 
+    if champion is None:
+        return None
 
-async def get_champion_id(champion_name: str) -> str:
-    champion_name = await search_for_champion(champion_name)
+    return champion.key
 
-    return (
-        await Champion
-        .select('id')
-        .where(Champion.name == champion_name)
-        .gino
-        .scalar()
-    )
 
+async def get_champion_id(champion_name: str) -> str | None:
+    champion = await resolve_champion(champion_name)
 
-async def get_champion_image(champion_name: str) -> str:
-    champion_name = await search_for_champion(champion_name)
+    if champion is None:
+        return None
 
-    return (
-        await Champion
-        .select('full_image')
-        .where(Champion.name == champion_name)
-        .gino
-        .scalar()
-    )
+    return champion.id
 
 
-async def get_champion_runes(champion_name: str) -> list[str]:
-    champion_id = await get_champion_id(champion_name)
+async def get_champion_image(champion_name: str) -> str | None:
+    champion = await resolve_champion(champion_name)
 
-    return (
-        await OPGGKRARAM
-        .select('runes')
-        .where(OPGGKRARAM.champion_id == champion_id)
-        .gino
-        .scalar()
-    )
+    if champion is None:
+        return None
 
+    return champion.full_image
 
-async def get_champion_items(champion_name: str) -> list[str]:
-    champion_id = await get_champion_id(champion_name)
 
-    return (
-        await OPGGKRARAM
-        .select('items')
-        .where(OPGGKRARAM.champion_id == champion_id)
-        .gino
-        .scalar()
-    )
+async def get_champion_runes(
+    champion_id: str,
+    region: str = REGION,
+    mode: str = MODE
+) -> list[str]:
+    build = await get_build(champion_id, region, mode)
 
+    if build is None:
+        return None
 
-async def get_champion_skill_order(champion_name: str) -> list[str]:
-    champion_id = await get_champion_id(champion_name)
+    return build.runes
 
-    return (
-        await OPGGKRARAM
-        .select('skills')
-        .where(OPGGKRARAM.champion_id == champion_id)
-        .gino
-        .scalar()
-    )
+
+async def get_champion_items(
+    champion_id: str,
+    region: str = REGION,
+    mode: str = MODE
+) -> list[str]:
+    build = await get_build(champion_id, region, mode)
+
+    if build is None:
+        return None
+
+    return build.items
+
+
+async def get_champion_skill_order(
+    champion_id: str,
+    region: str = REGION,
+    mode: str = MODE
+) -> list[str]:
+    build = await get_build(champion_id, region, mode)
+
+    if build is None:
+        return None
+
+    return build.skills
 
 
 async def get_rune_name(rune_id: str) -> str:
-    return (
-        await Rune
-        .select('name')
-        .where(Rune.id == rune_id)
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    rune = snapshot.rune.get(str(rune_id))
+
+    if rune is None:
+        return None
+
+    return rune.name
 
 
 async def get_item_name(item_id: str) -> str:
-    return (
-        await Item
-        .select('name')
-        .where(Item.id == item_id)
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    item = snapshot.item.get(str(item_id))
+
+    if item is None:
+        return None
+
+    return item.name
 
 
 async def get_core_item_name(item_id: str) -> str:
-    return (
-        await Item
-        .select('name')
-        .where(
-            (Item.id == item_id) &
-            (Item.ingredients.isnot(None))
-        )
-        .gino
-        .scalar()
-    )
+    snapshot = await catalog.get()
+    item = snapshot.item.get(str(item_id))
+
+    if item is None or item.ingredients is None:
+        return None
+
+    return item.name
 
 
 async def get_champion_names() -> list[str]:
-    champions = await Champion.select('name').gino.all()
-    return [champion.name for champion in champions]
+    snapshot = await catalog.get()
+    return list(snapshot.champion_name)
 
 
 async def get_spell_names() -> list[str]:
-    spells = await Spell.select('name').gino.all()
-    return [spell.name for spell in spells]
+    snapshot = await catalog.get()
+    return list(snapshot.spell_name)
 
 
-async def get_champion_statistics(champion_name: str) -> RowProxy:
-    return (
-        await Champion
-        .query
-        .where(Champion.name == champion_name)
-        .gino
-        .first()
-    )
+async def get_champion_statistics(champion_name: str) -> Champion:
+    snapshot = await catalog.get()
+    return snapshot.champion_name.get(champion_name)
 
 
-async def get_spell_statistics(spell_name: str) -> RowProxy:
-    return (
-        await Spell
-        .query
-        .where(Spell.name == spell_name)
-        .gino
-        .first()
-    )
+async def get_spell_statistics(spell_name: str) -> Spell:
+    snapshot = await catalog.get()
+    return snapshot.spell_name.get(spell_name)
 
 
-async def search_for_champion(champion_name: str) -> str:
-    champion_names = await get_champion_names()
+async def resolve_champion(champion_name: str) -> Champion | None:
+    snapshot = await catalog.get()
+    return snapshot.champion_index.search(champion_name)
 
-    match, score, _ = process.extractOne(
-        champion_name,
-        champion_names
-    )
 
-    return match
+async def resolve_spell(spell_name: str) -> Spell | None:
+    snapshot = await catalog.get()
+    return snapshot.spell_index.search(spell_name)
 
 
-async def search_for_spell(spell_name: str) -> str:
-    spell_names = await get_spell_names()
+async def search_for_champion(champion_name: str) -> str | None:
+    champion = await resolve_champion(champion_name)
 
-    match, score, _ = process.extractOne(
-        spell_name,
-        spell_names
-    )
+    if champion is None:
+        return None
+
+    return champion.name
+
+
+async def search_for_spell(spell_name: str) -> str | None:
+    spell = await resolve_spell(spell_name)
+
+    if spell is None:
+        return None
 
-    return match
+    return spell.name
 
 
-async def get_placement(leagues: dict[str, Any]) -> str:
+async def get_placement(leagues: list[League]) -> str:
     placement = ''
 
     display = {
@@ -319,15 +574,17 @@ async def get_placement(leagues: dict[str, Any]) -> str:
         'RANKED_TFT_DOUBLE_UP': 5,
     }
 
-    leagues.sort(
+    # The leagues may be shared with the cache, so they are sorted
+    # into a new list instead of in-place.
+    leagues = sorted(
+        leagues,
         key=lambda orderly: display[
-            orderly['queueType']
+            orderly.queue
         ]
     )
 
     for league in leagues:
-        queue = League(league)
-        placement = placement + f"{queue.queues}: {queue} \n"
+        placement = placement + f"{league.queues}: {league} \n"
 
     if not placement:
         placement = placement + 'Unranked'
@@ -348,8 +605,7 @@ async def get_mastery(
 
     champions = []
 
-    for masteries in get_masteries[:10]:
-        mastery = Mastery(masteries)
+    for mastery in get_masteries[:10]:
         name = await get_champion_name(mastery.id)
         champions.append(
             f"{name}: {mastery}"
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from collections.abc import Mapping
+
+
+def parse(header: str | None) -> list[tuple[int, int]]:
+    """
+    A function to parse a Riot rate limit header, such as "20:1,100:120",
+    into a list of (count, seconds) pairs.
+    """
+
+    if not header:
+        return []
+
+    pairs = []
+
+    for pair in header.split(','):
+        count, _, seconds = pair.partition(':')
+        pairs.append((int(count), int(seconds)))
+
+    return pairs
+
+
+class Bucket:
+    """
+    A token bucket that allows a limit of requests per interval, and
+    refills continuously.
+    """
+
+    def __init__(self, limit: int, interval: int):
+        self.limit = limit
+        self.interval = interval
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated
+
+        self.tokens = min(
+            self.limit,
+            self.tokens + elapsed * self.limit / self.interval
+        )
+
+        self.updated = now
+
+    def delay(self) -> float:
+        self.refill()
+
+        if self.tokens >= 1:
+            return 0.0
+
+        return (1 - self.tokens) * self.interval / self.limit
+
+    def consume(self) -> None:
+        self.tokens = self.tokens - 1
+
+    def synchronize(self, count: int) -> None:
+        """
+        A function that trusts Riot's count of the requests made in the
+        current window, if it is stricter than our own.
+        """
+
+        self.refill()
+        self.tokens = min(self.tokens, self.limit - count)
+
+
+class RateLimiter:
+    """
+    A rate limiter for the Riot API that honours both the application
+    limit, and the limit of each method. Requests are queued until a
+    token is available rather than failing.
+    """
+
+    def __init__(self, application: str = '20:1,100:120'):
+        self.application = [
+            Bucket(limit, interval)
+            for limit, interval in parse(application)
+        ]
+
+        self.method = {}
+        self.lock = {}
+        self.blocked = {}
+
+    def get_buckets(self, method: str) -> list[Bucket]:
+        return self.application + self.method.get(method, [])
+
+    def get_delay(self, method: str) -> float:
+        now = time.monotonic()
+
+        blocked = max(
+            self.blocked.get(None, 0),
+            self.blocked.get(method, 0)
+        )
+
+        delay = [blocked - now]
+
+        for bucket in self.get_buckets(method):
+            delay.append(bucket.delay())
+
+        return max(delay)
+
+    async def acquire(self, method: str) -> None:
+        """
+        A function that waits until a request can be made to a method
+        without exceeding either limit. Requests to the same method are
+        served in the order they arrive.
+        """
+
+        lock = self.lock.setdefault(method, asyncio.Lock())
+
+        async with lock:
+            while True:
+                delay = self.get_delay(method)
+
+                if delay <= 0:
+                    break
+
+                await asyncio.sleep(delay)
+
+            for bucket in self.get_buckets(method):
+                bucket.consume()
+
+    def adjust(
+        self,
+        buckets: list[Bucket],
+        limit: str | None,
+        count: str | None
+    ) -> list[Bucket]:
+        limits = parse(limit)
+
+        if limits:
+            current = [(bucket.limit, bucket.interval) for bucket in buckets]
+
+            if current != limits:
+                buckets = [
+                    Bucket(limit, interval)
+                    for limit, interval in limits
+                ]
+
+        counts = {
+            interval: amount
+            for amount, interval in parse(count)
+        }
+
+        for bucket in buckets:
+            if bucket.interval in counts:
+                bucket.synchronize(counts[bucket.interval])
+
+        return buckets
+
+    def update(self, method: str, response: ClientResponse) -> None:
+        """
+        A function that adjusts the buckets from the rate limit headers
+        of a response, and backs off when Riot responds with a 429.
+        """
+
+        headers = response.headers
+
+        self.application = self.adjust(
+            self.application,
+            headers.get('X-App-Rate-Limit'),
+            headers.get('X-App-Rate-Limit-Count')
+        )
+
+        self.method[method] = self.adjust(
+            self.method.get(method, []),
+            headers.get('X-Method-Rate-Limit'),
+            headers.get('X-Method-Rate-Limit-Count')
+        )
+
+        if response.status == 429:
+            self.block(method, headers)
+
+    def block(self, method: str, headers: Mapping[str, str]) -> None:
+        retry = headers.get('Retry-After')
+
+        if retry is None:
+            return
+
+        kind = headers.get('X-Rate-Limit-Type')
+
+        # Only a method limit is specific to the method. An application
+        # or service limit applies to every request.
+        key = method if kind == 'method' else None
+        self.blocked[key] = time.monotonic() + float(retry)
+
+    def headroom(self) -> dict[str, list[tuple[int, int, int]]]:
+        """
+        A function that returns the remaining requests, limit and
+        interval of every bucket.
+        """
+
+        headroom = {}
+
+        buckets = {'application': self.application, **self.method}
+
+        for name, bucket in buckets.items():
+            headroom[name] = []
+
+            for window in bucket:
+                window.refill()
+                remaining = max(0, int(window.tokens))
+
+                headroom[name].append(
+                    (remaining, window.limit, window.interval)
+                )
+
+        return headroom
@@ -2,14 +2,53 @@ from __future__ import annotations
 
 import aiohttp
 import asyncio
+import hashlib
+import json
+import logging
+import msgspec
+import random
 
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import TYPE_CHECKING
+from utilities.atomic import commit, discard, open_temporary
+from utilities.flight import SingleFlight
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
-    from collections.abc import Callable
+    from aiohttp import ClientResponse, ClientSession
+    from collections.abc import Awaitable, Callable, Mapping
+    from pathlib import Path
     from typing_extensions import Any
+    from utilities.executor import Executor
+
+
+log = logging.getLogger(__name__)
+
+
+# Identical GET requests that are in progress at the same time share
+# a single response. The number of requests that were saved is counted
+# by "coalesced".
+
+flights = SingleFlight()
+
+# The size of the buffer that a download is written from.
+
+BUFFER = 256 * 1024
+
+# A request is only sent again if it is idempotent, and if it failed
+# for a reason that is likely to be temporary.
+
+IDEMPOTENT = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+TRANSIENT = frozenset({429, 500, 502, 503, 504})
+
+RETRYABLE = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientResponseError,
+    json.JSONDecodeError,
+    msgspec.DecodeError,
+)
 
 
 class RequestError(Exception):
@@ -19,6 +58,10 @@ class RequestError(Exception):
     or failure to connect a host.
     """
 
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
 
 def error_handler(func: Callable) -> Callable:
     """A decorator to handle common errors while making a request."""
@@ -33,6 +76,12 @@ def error_handler(func: Callable) -> Callable:
         except aiohttp.InvalidURL as exception:
             message = 'The URL is invalid'
             raise RequestError(message) from exception
+        except msgspec.ValidationError as exception:
+            message = f"The response does not match the model: {exception}"
+            raise RequestError(message) from exception
+        except (json.JSONDecodeError, msgspec.DecodeError) as exception:
+            message = 'The response is not valid JSON.'
+            raise RequestError(message) from exception
         except aiohttp.ClientResponseError as exception:
             message = f"""
                 {exception.request_info.url}
@@ -40,53 +89,289 @@ def error_handler(func: Callable) -> Callable:
                 {exception.message}.
             """
 
-            raise RequestError(message) from exception
+            raise RequestError(message, exception.status) from exception
         except aiohttp.ClientConnectorError as exception:
             message = 'The client could not connect to the host.'
             raise RequestError(message) from exception
+        except aiohttp.ClientConnectionError as exception:
+            message = 'The connection to the host was lost.'
+            raise RequestError(message) from exception
 
     return wrapper
 
 
+class Retry:
+    """
+    A retry policy of exponential backoff with full jitter. A request
+    is attempted at most a number of times, and never waits longer than
+    its budget in total.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base: float = 0.5,
+        maximum: float = 8.0,
+        budget: float = 20.0
+    ):
+        self.attempts = attempts
+        self.base = base
+        self.maximum = maximum
+        self.budget = budget
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.maximum, self.base * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+
+RETRY = Retry()
+
+
+def get_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """
+    A function that returns the number of seconds to wait from a
+    Retry-After header, which is either a number of seconds or a date.
+    """
+
+    if not headers:
+        return None
+
+    retry = headers.get('Retry-After')
+
+    if retry is None:
+        return None
+
+    try:
+        return max(0.0, float(retry))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(retry)
+    except (TypeError, ValueError):
+        return None
+
+    now = datetime.now(timezone.utc)
+    return max(0.0, (date - now).total_seconds())
+
+
+def get_delay(
+    retry: Retry,
+    exception: Exception,
+    attempt: int
+) -> float | None:
+    """
+    A function that returns the number of seconds to wait before the
+    next attempt, or None if the request should not be attempted again.
+    """
+
+    # A response that does not match its model will not match it on
+    # the next attempt either.
+    if isinstance(exception, msgspec.ValidationError):
+        return None
+
+    if isinstance(exception, aiohttp.ClientResponseError):
+        if exception.status not in TRANSIENT:
+            return None
+
+        if exception.status in (429, 503):
+            delay = get_retry_after(exception.headers)
+
+            if delay is not None:
+                return delay
+
+    return retry.backoff(attempt)
+
+
 @error_handler
 async def download(
     session: ClientSession,
     url: str,
-    path: str,
+    path: Path,
+    executor: Executor | None = None,
+    maximum: int | None = None,
+    buffer: int = BUFFER,
     **options: dict[str, Any]
-) -> None:
-    lock = asyncio.Lock()
-    async with lock:
-        async with session.get(
-            url,
-            timeout=15,
-            raise_for_status=True,
-            **options
-        ) as response:
-            directory = path.parent
-            directory.mkdir(exist_ok=True)
+) -> str:
+    """
+    A function that streams a download into a temporary file, which is
+    only renamed into place once it is complete, and returns the
+    SHA-256 of its content. A download larger than the maximum is
+    aborted as soon as the limit is exceeded.
+    """
 
-            filename = path.name
-            path = directory / filename
+    run = executor.io if executor is not None else asyncio.to_thread
 
-            with path.open('w+b') as file:
-                async for chunk in response.content.iter_chunked(1024):
-                    if not chunk:
-                        break
+    async with session.get(
+        url,
+        raise_for_status=True,
+        **options
+    ) as response:
+        length = response.content_length
+
+        if maximum is not None and length is not None and length > maximum:
+            message = f"{url} is {length} bytes, which exceeds {maximum} bytes."
+            raise RequestError(message, 413)
+
+        file, temporary = await run(open_temporary, path)
+
+        digest = hashlib.sha256()
+        pending = bytearray()
+        size = 0
+
+        try:
+            async for chunk in response.content.iter_chunked(buffer):
+                size = size + len(chunk)
+
+                if maximum is not None and size > maximum:
+                    message = f"{url} exceeds {maximum} bytes."
+                    raise RequestError(message, 413)
+
+                digest.update(chunk)
+                pending.extend(chunk)
+
+                # The chunks are gathered into a large buffer, so the
+                # file is written by the thread pool less often.
+                if len(pending) >= buffer:
+                    await run(file.write, bytes(pending))
+                    pending.clear()
+
+            if pending:
+                await run(file.write, bytes(pending))
+
+            await run(commit, file, temporary, path)
+        except BaseException:
+            await asyncio.shield(
+                run(discard, file, temporary)
+            )
+
+            raise
+
+    return digest.hexdigest()
+
+
+async def send(
+    session: ClientSession,
+    method: str,
+    url: str,
+    callback: Callable[[ClientResponse], None] | None = None,
+    model: Any = None,
+    **options: dict[str, Any]
+) -> Any:
+    async with session.request(
+        method,
+        url,
+        **options
+    ) as response:
+        # The callback is able to inspect the headers of every
+        # response, including those of an error.
+        if callback is not None:
+            callback(response)
+
+        response.raise_for_status()
+
+        if model is None:
+            return await response.json()
 
-                    file.write(chunk)
+        # The body is decoded straight into the model, without building
+        # a dictionary first.
+        body = await response.read()
+        return msgspec.json.decode(body, type=model)
+
+
+async def request(
+    session: ClientSession,
+    url: str,
+    callback: Callable[[ClientResponse], None] | None = None,
+    before: Callable[[], Awaitable[None]] | None = None,
+    retry: Retry = RETRY,
+    method: str = 'GET',
+    model: Any = None,
+    **options: dict[str, Any]
+) -> Any:
+    attempts = retry.attempts if method in IDEMPOTENT else 1
+    waited = 0.0
+
+    for attempt in range(attempts):
+        # The hook is awaited before every attempt, so a retry is
+        # subject to the same rate limit as the first request.
+        if before is not None:
+            await before()
+
+        try:
+            return await send(
+                session,
+                method,
+                url,
+                callback,
+                model,
+                **options
+            )
+        except RETRYABLE as exception:
+            delay = get_delay(retry, exception, attempt)
+
+            if (
+                delay is None or
+                attempt + 1 >= attempts or
+                waited + delay > retry.budget
+            ):
+                raise
+
+            log.info(f"Retrying {url} in {delay:.1f} seconds: {exception!r}")
+
+            waited = waited + delay
+            await asyncio.sleep(delay)
+
+
+def get_key(
+    url: str,
+    model: Any,
+    options: dict[str, Any]
+) -> tuple[str, Any, str]:
+    return (url, model, repr(sorted(options.items())))
 
 
 @error_handler
 async def fetch(
     session: ClientSession,
     url: str,
+    callback: Callable[[ClientResponse], None] | None = None,
+    before: Callable[[], Awaitable[None]] | None = None,
+    retry: Retry = RETRY,
+    method: str = 'GET',
+    model: Any = None,
     **options: dict[str, Any]
-) -> dict[str, Any]:
-    async with session.get(
+) -> Any:
+    """
+    A function that requests JSON from a URL, and decodes it into a
+    model if one is given. A GET request that is identical to one in
+    progress waits for its response instead, so the callback and hook
+    are only called by the first caller.
+    """
+
+    if method != 'GET':
+        return await request(
+            session,
+            url,
+            callback,
+            before,
+            retry,
+            method,
+            model,
+            **options
+        )
+
+    key = get_key(url, model, options)
+
+    return await flights.run(
+        key,
+        request,
+        session,
         url,
-        timeout=15,
-        raise_for_status=True,
+        callback,
+        before,
+        retry,
+        method,
+        model,
         **options
-    ) as response:
-        return await response.json()
+    )
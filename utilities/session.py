@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import aiohttp
+import logging
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from aiohttp.abc import AbstractResolver
+    from configparser import RawConfigParser
+    from typing_extensions import Any
+
+
+log = logging.getLogger(__name__)
+
+
+# Each upstream has its own session, so a slow host can not exhaust the
+# connections of another. The settings of an upstream are read from its
+# own section (e.g. [session.riot]), then from [session], then from
+# these defaults.
+
+UPSTREAMS = ('default', 'riot', 'ddragon', 'owm', 'forismatic')
+
+DEFAULT = {
+    'limit': 100,
+    'limit_per_host': 10,
+    'keepalive': 60.0,
+    'dns': 300,
+    'total': 15.0,
+    'connect': 5.0,
+    'read': 10.0,
+}
+
+# A patch from Data Dragon is a large number of images, so its requests
+# are allowed more time and connections.
+
+OVERRIDE = {
+    'ddragon': {
+        'limit_per_host': 16,
+        'total': 120.0,
+        'read': 30.0,
+    },
+}
+
+
+def get_settings(configuration: RawConfigParser, name: str) -> dict[str, Any]:
+    settings = {
+        **DEFAULT,
+        **OVERRIDE.get(name, {})
+    }
+
+    for section in ('session', f"session.{name}"):
+        if not configuration.has_section(section):
+            continue
+
+        for key, value in settings.items():
+            get = (
+                configuration.getfloat
+                if isinstance(value, float)
+                else configuration.getint
+            )
+
+            settings[key] = get(section, key, fallback=value)
+
+    return settings
+
+
+def get_resolver() -> AbstractResolver:
+    """
+    A function that returns an asynchronous DNS resolver, or the
+    threaded resolver if aiodns is not installed.
+    """
+
+    try:
+        return aiohttp.AsyncResolver()
+    except RuntimeError as exception:
+        log.warning(exception)
+        return aiohttp.ThreadedResolver()
+
+
+def create_session(settings: dict[str, Any]) -> ClientSession:
+    connector = aiohttp.TCPConnector(
+        resolver=get_resolver(),
+        limit=settings['limit'],
+        limit_per_host=settings['limit_per_host'],
+        keepalive_timeout=settings['keepalive'],
+        ttl_dns_cache=settings['dns'],
+        use_dns_cache=True
+    )
+
+    timeout = aiohttp.ClientTimeout(
+        total=settings['total'],
+        connect=settings['connect'],
+        sock_read=settings['read']
+    )
+
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout
+    )
+
+
+class Sessions:
+    """
+    A session for each upstream, with a DNS cache and connections that
+    are kept alive, so most requests skip the lookup and TLS handshake.
+    """
+
+    def __init__(self, configuration: RawConfigParser):
+        self.sessions = {
+            name: create_session(
+                get_settings(configuration, name)
+            )
+            for name in UPSTREAMS
+        }
+
+    @property
+    def default(self) -> ClientSession:
+        return self.sessions['default']
+
+    @property
+    def riot(self) -> ClientSession:
+        return self.sessions['riot']
+
+    @property
+    def ddragon(self) -> ClientSession:
+        return self.sessions['ddragon']
+
+    @property
+    def owm(self) -> ClientSession:
+        return self.sessions['owm']
+
+    @property
+    def forismatic(self) -> ClientSession:
+        return self.sessions['forismatic']
+
+    async def close(self) -> None:
+        for session in self.sessions.values():
+            await session.close()